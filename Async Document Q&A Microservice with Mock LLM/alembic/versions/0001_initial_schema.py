@@ -0,0 +1,63 @@
+"""initial schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+question_status = sa.Enum('PENDING', 'ANSWERED', name='questionstatus')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'documents',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_documents_id', 'documents', ['id'], unique=False)
+    op.create_index('ix_documents_title', 'documents', ['title'], unique=False)
+
+    op.create_table(
+        'questions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('document_id', sa.Integer(), nullable=False),
+        sa.Column('question', sa.Text(), nullable=False),
+        sa.Column('answer', sa.Text(), nullable=True),
+        sa.Column('status', question_status, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['document_id'], ['documents.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_questions_id', 'questions', ['id'], unique=False)
+    # Polling by status in creation order (e.g. oldest pending questions first)
+    op.create_index('ix_questions_status_created_at', 'questions', ['status', 'created_at'], unique=False)
+    # Per-document listings; also covers plain lookups by document_id
+    op.create_index('ix_questions_document_id_id', 'questions', ['document_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_questions_document_id_id', table_name='questions')
+    op.drop_index('ix_questions_status_created_at', table_name='questions')
+    op.drop_index('ix_questions_id', table_name='questions')
+    op.drop_table('questions')
+    question_status.drop(op.get_bind(), checkfirst=True)
+
+    op.drop_index('ix_documents_title', table_name='documents')
+    op.drop_index('ix_documents_id', table_name='documents')
+    op.drop_table('documents')
@@ -0,0 +1,25 @@
+"""index questions by status and updated_at
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Incremental answer exports scan answered questions from a watermark
+    op.create_index('ix_questions_status_updated_at', 'questions', ['status', 'updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_questions_status_updated_at', table_name='questions')
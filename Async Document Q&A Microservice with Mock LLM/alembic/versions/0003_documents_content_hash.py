@@ -0,0 +1,67 @@
+"""add documents.content_hash for deduplication
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import hashlib
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 500
+
+documents = sa.table(
+    'documents',
+    sa.column('id', sa.Integer()),
+    sa.column('content', sa.Text()),
+    sa.column('content_hash', sa.String(64)),
+)
+
+
+def upgrade() -> None:
+    op.add_column('documents', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    
+    # Backfill in id order and in bounded batches. Only the oldest copy of
+    # already duplicated content gets the hash; later copies keep NULL so the
+    # unique index can be created and new uploads resolve to the oldest one.
+    bind = op.get_bind()
+    seen = set()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(documents.c.id, documents.c.content)
+            .where(documents.c.id > last_id)
+            .order_by(documents.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        updates = []
+        for document_id, content in rows:
+            digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            if digest not in seen:
+                seen.add(digest)
+                updates.append({'document_id': document_id, 'digest': digest})
+        if updates:
+            bind.execute(
+                documents.update()
+                .where(documents.c.id == sa.bindparam('document_id'))
+                .values(content_hash=sa.bindparam('digest')),
+                updates,
+            )
+        last_id = rows[-1][0]
+    
+    op.create_index('ix_documents_content_hash', 'documents', ['content_hash'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documents_content_hash', table_name='documents')
+    op.drop_column('documents', 'content_hash')
@@ -0,0 +1,33 @@
+"""index questions_archive by answered_at
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Exports read the archive alongside questions; incremental exports seek
+    # from a watermark instead of scanning and sorting the whole archive
+    op.create_index('ix_questions_archive_answered_at', 'questions_archive', ['answered_at'], unique=False)
+    op.create_index(
+        'ix_questions_archive_document_id_answered_at',
+        'questions_archive',
+        ['document_id', 'answered_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_questions_archive_document_id_answered_at', table_name='questions_archive')
+    op.drop_index('ix_questions_archive_answered_at', table_name='questions_archive')
@@ -0,0 +1,56 @@
+import hashlib
+from typing import Optional
+from fastapi.responses import Response
+
+from ..config import settings
+from ..models.question import QuestionStatus
+
+# Shared caches may store the response but must revalidate it with the ETag
+REVALIDATE = "no-cache"
+
+
+def make_etag(kind: str, object_id: int, *version) -> str:
+    """Build a strong ETag from an object's identity and version fields"""
+    raw = ":".join([kind, str(object_id), *(str(part) for part in version)])
+    return '"' + hashlib.blake2b(raw.encode(), digest_size=12).hexdigest() + '"'
+
+
+def document_etag(document) -> str:
+    """ETag for a document row or response"""
+    return make_etag("document", document.id, document.created_at, document.updated_at)
+
+
+def question_etag(question) -> str:
+    """ETag for a question row or response"""
+    return make_etag("question", question.id, question.status.value, question.created_at, question.updated_at)
+
+
+def question_cache_control(status: QuestionStatus) -> str:
+    """Answered questions are immutable; pending ones must be revalidated"""
+    if status == QuestionStatus.ANSWERED:
+        return f"public, max-age={settings.answered_question_max_age}, immutable"
+    return REVALIDATE
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header against the current ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison function
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+
+def cached_json(body: bytes, etag: str, cache_control: str) -> Response:
+    """Response for an already serialized JSON body"""
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
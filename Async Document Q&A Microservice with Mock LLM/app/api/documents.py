@@ -1,24 +1,47 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from typing import TYPE_CHECKING, List, Optional
 
+from ..cache import response_cache
 from ..database import get_db
 from ..services.document_service import DocumentService
 from ..schemas.document import DocumentCreate, DocumentResponse
+from .responses import ModelResponse
+from .caching import (
+    REVALIDATE,
+    cached_json,
+    document_etag,
+    etag_matches,
+    not_modified,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
 
-@router.post("/", response_model=DocumentResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/",
+    response_model=DocumentResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_200_OK: {"model": DocumentResponse, "description": "Identical content already exists"}}
+)
 async def create_document(
     document_data: DocumentCreate,
-    db: AsyncSession = Depends(get_db)
+    db: "AsyncSession" = Depends(get_db)
 ):
-    """Upload a new document"""
+    """Upload a new document
+
+    Re-uploading content that already exists returns the existing document
+    with 200 instead of storing another copy.
+    """
     try:
         service = DocumentService(db)
-        document = await service.create_document(document_data)
-        return document
+        document, created = await service.get_or_create_document(document_data)
+        return ModelResponse(
+            document,
+            status_code=status.HTTP_201_CREATED if created else status.HTTP_200_OK
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -29,11 +52,35 @@ async def create_document(
 @router.get("/{document_id}", response_model=DocumentResponse)
 async def get_document(
     document_id: int,
-    db: AsyncSession = Depends(get_db)
+    if_none_match: Optional[str] = Header(None),
+    db: "AsyncSession" = Depends(get_db)
 ):
-    """Retrieve a document by ID"""
+    """Retrieve a document by ID
+
+    Conditional requests and cached bodies are validated against the
+    document's timestamps, which are read without loading its content.
+    """
     try:
         service = DocumentService(db)
+        cache_key = ("document", document_id)
+        cached = response_cache.get(cache_key)
+        
+        if if_none_match or cached:
+            version = await service.get_document_version(document_id)
+            
+            if not version:
+                response_cache.pop(cache_key)
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Document with ID {document_id} not found"
+                )
+            
+            etag = document_etag(version)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag, REVALIDATE)
+            if cached and cached[0] == etag:
+                return cached_json(cached[1], etag, REVALIDATE)
+        
         document = await service.get_document(document_id)
         
         if not document:
@@ -42,11 +89,14 @@ async def get_document(
                 detail=f"Document with ID {document_id} not found"
             )
         
-        return document
+        etag = document_etag(document)
+        response = ModelResponse(document, headers={"ETag": etag, "Cache-Control": REVALIDATE})
+        response_cache.put(cache_key, (etag, response.body), len(response.body))
+        return response
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve document"
-        ) 
\ No newline at end of file
+        )
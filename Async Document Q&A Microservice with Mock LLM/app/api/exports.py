@@ -0,0 +1,70 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from typing import TYPE_CHECKING, List, Optional
+from datetime import datetime
+
+from ..database import get_db, get_session_factory
+from ..services.export_service import (
+    EXPORT_FORMATS,
+    ExportService,
+    check_export_format,
+    encode_answers,
+)
+from ..schemas.export import LatencyStats
+from .responses import ModelResponse
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+
+async def _stream_answers(export_format: str, document_id: Optional[int], since: Optional[datetime]):
+    # The export outlives the request handler, so it owns its session
+    async with get_session_factory()() as db:
+        batches = ExportService(db).iter_answers(document_id=document_id, since=since)
+        async for chunk in encode_answers(batches, export_format):
+            yield chunk
+
+
+@router.get("/answers")
+async def export_answers(
+    format: str = Query("ndjson", description="ndjson, csv or parquet"),
+    document_id: Optional[int] = Query(None, description="Only export questions about this document"),
+    since: Optional[datetime] = Query(None, description="Only export questions answered at or after this time"),
+):
+    """Stream answered questions with their answer latency
+
+    Includes archived questions. Rows are ordered by answer time; pass the last exported ``answered_at``
+    as ``since`` for an incremental export.
+    """
+    try:
+        check_export_format(format)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return StreamingResponse(
+        _stream_answers(format, document_id, since),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="answers.{format}"'}
+    )
+
+
+@router.get("/latency", response_model=List[LatencyStats])
+async def answer_latency(
+    document_id: Optional[int] = Query(None, description="Only report this document"),
+    since: Optional[datetime] = Query(None, description="Only include questions answered at or after this time"),
+    db: "AsyncSession" = Depends(get_db)
+):
+    """Answer latency percentiles per document, including archived questions"""
+    try:
+        stats = await ExportService(db).answer_latency_stats(document_id=document_id, since=since)
+        return ModelResponse(stats)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to compute answer latency"
+        )
@@ -1,11 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from typing import TYPE_CHECKING, List, Optional
 
+from ..cache import response_cache
 from ..database import get_db
 from ..services.question_service import QuestionService
 from ..services.document_service import DocumentService
+from ..models.question import QuestionStatus
 from ..schemas.question import QuestionCreate, QuestionResponse
+from .responses import ModelResponse
+from .caching import (
+    cached_json,
+    etag_matches,
+    not_modified,
+    question_cache_control,
+    question_etag,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(prefix="/questions", tags=["questions"])
 
@@ -14,7 +26,7 @@ router = APIRouter(prefix="/questions", tags=["questions"])
 async def create_question(
     document_id: int,
     question_data: QuestionCreate,
-    db: AsyncSession = Depends(get_db)
+    db: "AsyncSession" = Depends(get_db)
 ):
     """Submit a question about a specific document"""
     try:
@@ -32,7 +44,7 @@ async def create_question(
         service = QuestionService(db)
         question = await service.create_question(document_id, question_data)
         
-        return question
+        return ModelResponse(question, status_code=status.HTTP_201_CREATED)
     except HTTPException:
         raise
     except ValueError as e:
@@ -50,11 +62,37 @@ async def create_question(
 @router.get("/{question_id}", response_model=QuestionResponse)
 async def get_question(
     question_id: int,
-    db: AsyncSession = Depends(get_db)
+    if_none_match: Optional[str] = Header(None),
+    db: "AsyncSession" = Depends(get_db)
 ):
-    """Get question status and answer"""
+    """Get question status and answer
+
+    Answered questions never change, so they are served from the in-process
+    cache without a query and may be cached by upstream proxies. Conditional
+    requests for pending questions are answered from a lookup of the status
+    and timestamps only.
+    """
     try:
+        cache_key = ("question", question_id)
+        cached = response_cache.get(cache_key)
+        
+        if cached:
+            etag, body = cached
+            cache_control = question_cache_control(QuestionStatus.ANSWERED)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag, cache_control)
+            return cached_json(body, etag, cache_control)
+        
         service = QuestionService(db)
+        
+        if if_none_match:
+            version = await service.get_question_version(question_id)
+            
+            if version:
+                etag = question_etag(version)
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag, question_cache_control(version.status))
+        
         question = await service.get_question(question_id)
         
         if not question:
@@ -63,11 +101,18 @@ async def get_question(
                 detail=f"Question with ID {question_id} not found"
             )
         
-        return question
+        etag = question_etag(question)
+        response = ModelResponse(
+            question,
+            headers={"ETag": etag, "Cache-Control": question_cache_control(question.status)}
+        )
+        if question.status == QuestionStatus.ANSWERED:
+            response_cache.put(cache_key, (etag, response.body), len(response.body))
+        return response
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve question"
-        ) 
\ No newline at end of file
+        )
@@ -0,0 +1,17 @@
+from typing import Any
+from fastapi.responses import Response
+from pydantic_core import to_json
+
+
+class ModelResponse(Response):
+    """JSON response rendered directly by pydantic's serializer.
+
+    Returning a Response from an endpoint skips FastAPI's ``response_model``
+    validation, so a response schema is serialized once instead of being
+    validated again and then encoded. The endpoint's ``response_model`` is
+    still used for the OpenAPI schema.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
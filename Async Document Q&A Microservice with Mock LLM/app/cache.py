@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from .config import settings
+
+
+class LRUCache:
+    """Bounded in-process cache that evicts the least recently used entry
+
+    Bounded by entry count and, when ``maxbytes`` is set, by the total size
+    passed to ``put``. Values larger than ``maxbytes`` are not cached.
+    """
+
+    def __init__(self, maxsize: int, maxbytes: Optional[int] = None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value and mark it as recently used"""
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            return None
+        return self._entries[key]
+
+    def put(self, key: Hashable, value: Any, size: int = 0):
+        """Store a value of ``size`` bytes, evicting the oldest entries when full"""
+        if self.maxsize <= 0:
+            return
+        self.pop(key)
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+        self._entries[key] = value
+        self._sizes[key] = size
+        self.nbytes += size
+        while len(self._entries) > self.maxsize or (
+            self.maxbytes is not None and self.nbytes > self.maxbytes
+        ):
+            oldest, _ = self._entries.popitem(last=False)
+            self.nbytes -= self._sizes.pop(oldest)
+
+    def pop(self, key: Hashable):
+        """Remove a key if present"""
+        if self._entries.pop(key, None) is not None:
+            self.nbytes -= self._sizes.pop(key)
+
+    def clear(self):
+        self._entries.clear()
+        self._sizes.clear()
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Serialized response bodies for hot IDs, keyed by (kind, id) and stored
+# together with the ETag they were rendered for. Bounded by total body size
+# as well as count, since document bodies can be megabytes each.
+response_cache = LRUCache(settings.response_cache_size, settings.response_cache_max_bytes)
+
+
+def evict_question(question_id: int):
+    """Drop a question's cached response, e.g. once it is archived"""
+    response_cache.pop(("question", question_id))
@@ -1,36 +1,139 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import declarative_base
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+import asyncio
 from .config import settings
 
-# Create async engine
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    future=True
-)
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 
-# Create async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False
-)
+# Alembic revision this code expects; bump together with every new migration
+SCHEMA_REVISION = "0005"
+
+# The engine and session factory are created on first use rather than at
+# import time, so importing the app loads neither the database driver nor
+# SQLAlchemy's asyncio extension.
+_engine = None
+_session_factory = None
+
+# SQLite allows a single writer at a time. Writes from this process are
+# serialized through this lock instead of contending for the database lock.
+_write_lock = None
+
+# Applied to every new SQLite connection
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",  # readers do not block the writer and vice versa
+    "synchronous": "NORMAL",  # fsync on checkpoint only; durable enough with WAL
+    "foreign_keys": "ON",
+    "busy_timeout": settings.sqlite_busy_timeout_ms,  # wait for other processes' writes
+    "cache_size": -65536,  # 64MB page cache (negative values are KiB)
+    "temp_store": "MEMORY",
+    "mmap_size": 268435456,  # 256MB memory-mapped reads
+}
 
 # Create base class for models
 Base = declarative_base()
 
 
+def is_sqlite(url: str = None) -> bool:
+    """Whether the configured (or given) database URL uses SQLite"""
+    return make_url(url or settings.database_url).get_backend_name() == "sqlite"
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+def get_engine() -> "AsyncEngine":
+    """Return the process-wide async engine, creating it on first use"""
+    global _engine, _write_lock
+    if _engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+        
+        _engine = create_async_engine(
+            settings.database_url,
+            echo=settings.debug,
+            future=True
+        )
+        if is_sqlite():
+            event.listen(_engine.sync_engine, "connect", _set_sqlite_pragmas)
+            _write_lock = asyncio.Lock()
+    return _engine
+
+
+def get_session_factory() -> "async_sessionmaker":
+    """Return the async session factory bound to the engine"""
+    global _session_factory
+    if _session_factory is None:
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+        
+        _session_factory = async_sessionmaker(
+            get_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False
+        )
+    return _session_factory
+
+
+async def dispose_engine():
+    """Close pooled connections and drop the engine"""
+    global _engine, _session_factory, _write_lock
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_factory = None
+    _write_lock = None
+
+
+@asynccontextmanager
+async def single_writer():
+    """Serialize a write transaction on single-writer backends.
+
+    SQLite has one database-wide write lock. Without this, concurrent writers
+    in the process would each hold a pooled connection while SQLite's busy
+    handler polls for the lock with backoff; queuing on an asyncio lock hands
+    it over as soon as the previous commit finishes. PostgreSQL uses row
+    locks, so this is a no-op there.
+    """
+    get_engine()
+    if _write_lock is None:
+        yield
+        return
+    async with _write_lock:
+        yield
+
+
 async def get_db():
     """Dependency to get database session"""
-    async with AsyncSessionLocal() as session:
+    async with get_session_factory()() as session:
         try:
             yield session
         finally:
             await session.close()
 
 
-async def init_db():
-    """Initialize database tables"""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all) 
\ No newline at end of file
+async def verify_schema():
+    """Check that the database has been migrated to SCHEMA_REVISION.
+
+    Schema changes are applied out of band with ``alembic upgrade head``;
+    startup only reads the recorded version so replicas never race on DDL.
+    """
+    async with get_engine().connect() as conn:
+        try:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+            current = result.scalar_one_or_none()
+        except DBAPIError:
+            # alembic_version does not exist yet
+            current = None
+
+    if current != SCHEMA_REVISION:
+        raise RuntimeError(
+            f"Database schema is at revision {current!r}, expected {SCHEMA_REVISION!r}; "
+            "run 'alembic upgrade head'"
+        )
@@ -1,11 +1,16 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
-import uvicorn
+from contextlib import asynccontextmanager, suppress
+import asyncio
 
 from .config import settings
-from .database import init_db
-from .api import documents, questions
+from .database import verify_schema, dispose_engine
+from .api import documents, questions, exports
+from .services.retention_service import run_archival_job
+from .services.mock_llm import get_mock_llm
+from .services.question_service import llm_failures
+
+SERVICE_NAME = "Async Document Q&A Microservice"
 
 
 @asynccontextmanager
@@ -13,18 +18,29 @@ async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
     try:
-        await init_db()
+        await verify_schema()
+        # Reject an invalid MOCK_LLM_* configuration before serving
+        get_mock_llm()
     except Exception as e:
         raise
     
+    archival_job = None
+    if settings.question_retention_days > 0:
+        archival_job = asyncio.create_task(run_archival_job())
+    
     yield
     
     # Shutdown
+    if archival_job:
+        archival_job.cancel()
+        with suppress(asyncio.CancelledError):
+            await archival_job
+    await dispose_engine()
 
 
 # Create FastAPI app
 app = FastAPI(
-    title="Async Document Q&A Microservice",
+    title=SERVICE_NAME,
     description="A microservice for document Q&A with async LLM processing",
     version="1.0.0",
     lifespan=lifespan
@@ -42,12 +58,29 @@ app.add_middleware(
 # Include routers
 app.include_router(documents.router)
 app.include_router(questions.router)
+app.include_router(exports.router)
+
+
+@app.get("/")
+async def root():
+    """Service information"""
+    return {"message": SERVICE_NAME, "docs": "/docs", "health": "/health"}
+
+
+@app.get("/health")
+async def health_check():
+    """Liveness probe; does not touch the database"""
+    return {"status": "healthy", "service": SERVICE_NAME, "llm_failures": dict(llm_failures)}
 
 
 if __name__ == "__main__":
+    # Imported here so that serving the app through an external ASGI
+    # server does not pay for it on every cold start
+    import uvicorn
+
     uvicorn.run(
         "app.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.debug
-    ) 
\ No newline at end of file
+    )
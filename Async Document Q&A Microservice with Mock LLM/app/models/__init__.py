@@ -1,4 +1,5 @@
 from .document import Document
 from .question import Question
+from .question_archive import ArchivedQuestion
 
-__all__ = ["Document", "Question"] 
\ No newline at end of file
+__all__ = ["Document", "Question", "ArchivedQuestion"]
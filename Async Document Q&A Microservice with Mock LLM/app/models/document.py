@@ -1,7 +1,14 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database import Base
+from .types import UTCDateTime
+import hashlib
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 hex digest identifying a document's content"""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
 class Document(Base):
@@ -10,8 +17,10 @@ class Document(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False, index=True)
     content = Column(Text, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # NULL only for duplicates that existed before deduplication was added
+    content_hash = Column(String(64), nullable=True, unique=True, index=True)
+    created_at = Column(UTCDateTime, server_default=func.now())
+    updated_at = Column(UTCDateTime, onupdate=func.now())
     
     # Relationship with questions
     questions = relationship("Question", back_populates="document", cascade="all, delete-orphan")
@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
 from ..database import Base
+from .types import UTCDateTime
 
 
 class QuestionStatus(str, enum.Enum):
@@ -12,14 +13,19 @@ class QuestionStatus(str, enum.Enum):
 
 class Question(Base):
     __tablename__ = "questions"
+    __table_args__ = (
+        Index("ix_questions_status_created_at", "status", "created_at"),
+        Index("ix_questions_status_updated_at", "status", "updated_at"),
+        Index("ix_questions_document_id_id", "document_id", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    document_id = Column(Integer, ForeignKey("documents.id"), nullable=False, index=True)
+    document_id = Column(Integer, ForeignKey("documents.id"), nullable=False)
     question = Column(Text, nullable=False)
     answer = Column(Text, nullable=True)
     status = Column(Enum(QuestionStatus), default=QuestionStatus.PENDING, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(UTCDateTime, server_default=func.now())
+    updated_at = Column(UTCDateTime, onupdate=func.now())
     
     # Relationship with document
     document = relationship("Document", back_populates="questions")
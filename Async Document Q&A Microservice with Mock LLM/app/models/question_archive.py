@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, Text, Index
+from ..database import Base
+from .types import UTCDateTime
+
+
+class ArchivedQuestion(Base):
+    """Answered question moved out of ``questions`` by the retention job.
+
+    Only keeps what the answer history needs, indexed just for exports,
+    which read it in answer order, so the archive stays compact and cheap to
+    append to.
+    """
+    __tablename__ = "questions_archive"
+    __table_args__ = (
+        Index("ix_questions_archive_answered_at", "answered_at"),
+        Index("ix_questions_archive_document_id_answered_at", "document_id", "answered_at"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)  # original question id
+    document_id = Column(Integer, nullable=False)
+    question = Column(Text, nullable=False)
+    answer = Column(Text, nullable=True)
+    created_at = Column(UTCDateTime, nullable=True)
+    answered_at = Column(UTCDateTime, nullable=True)
+    
+    def __repr__(self):
+        return f"<ArchivedQuestion(id={self.id}, document_id={self.document_id})>"
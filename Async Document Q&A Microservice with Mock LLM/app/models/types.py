@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+from sqlalchemy import DateTime
+from sqlalchemy.types import TypeDecorator
+
+
+class UTCDateTime(TypeDecorator):
+    """Timezone-aware UTC timestamp on every backend.
+
+    PostgreSQL stores ``timestamptz`` and returns aware values. SQLite has no
+    timezone support: values are stored as naive UTC text and would come back
+    naive, so they are converted to UTC on the way in and tagged as UTC on
+    the way out.
+    """
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or not isinstance(value, datetime):
+            return value
+        if value.tzinfo is None:
+            # Naive values are taken to be UTC
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    def process_result_value(self, value, dialect):
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
@@ -1,4 +1,5 @@
 from .document import DocumentCreate, DocumentResponse
 from .question import QuestionCreate, QuestionResponse
+from .export import LatencyStats
 
-__all__ = ["DocumentCreate", "DocumentResponse", "QuestionCreate", "QuestionResponse"] 
\ No newline at end of file
+__all__ = ["DocumentCreate", "DocumentResponse", "QuestionCreate", "QuestionResponse", "LatencyStats"] 
\ No newline at end of file
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+
+class RecordResponse(BaseModel):
+    """Base class for response schemas built from database records"""
+
+    @classmethod
+    def from_record(cls, record):
+        """Build the response from an ORM object or result row.
+
+        Values coming from the database are already typed, so the model is
+        constructed without validation.
+        """
+        return cls.model_construct(**{name: getattr(record, name) for name in cls.model_fields})
+
+    class Config:
+        from_attributes = True
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
+from .base import RecordResponse
 
 
 class DocumentCreate(BaseModel):
@@ -8,12 +9,9 @@ class DocumentCreate(BaseModel):
     content: str = Field(..., min_length=1, description="Document content")
 
 
-class DocumentResponse(BaseModel):
+class DocumentResponse(RecordResponse):
     id: int
     title: str
     content: str
     created_at: datetime
     updated_at: Optional[datetime] = None
-    
-    class Config:
-        from_attributes = True 
\ No newline at end of file
@@ -0,0 +1,12 @@
+from typing import Optional
+from .base import RecordResponse
+
+
+class LatencyStats(RecordResponse):
+    """Answer latency (question created to answered) for one document, in seconds"""
+    document_id: int
+    answered: int
+    mean_seconds: Optional[float] = None
+    p50_seconds: Optional[float] = None
+    p90_seconds: Optional[float] = None
+    p99_seconds: Optional[float] = None
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
+from .base import RecordResponse
 from ..models.question import QuestionStatus
 
 
@@ -8,7 +9,7 @@ class QuestionCreate(BaseModel):
     question: str = Field(..., min_length=1, description="Question about the document")
 
 
-class QuestionResponse(BaseModel):
+class QuestionResponse(RecordResponse):
     id: int
     document_id: int
     question: str
@@ -16,6 +17,3 @@ class QuestionResponse(BaseModel):
     status: QuestionStatus
     created_at: datetime
     updated_at: Optional[datetime] = None
-    
-    class Config:
-        from_attributes = True 
\ No newline at end of file
@@ -1,4 +1,6 @@
 from .document_service import DocumentService
 from .question_service import QuestionService
+from .export_service import ExportService
+from .retention_service import RetentionService
 
-__all__ = ["DocumentService", "QuestionService"] 
\ No newline at end of file
+__all__ = ["DocumentService", "QuestionService", "ExportService", "RetentionService"] 
\ No newline at end of file
@@ -1,27 +1,71 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List, Optional
+from sqlalchemy import select, bindparam
+from sqlalchemy.exc import IntegrityError
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from ..models.document import Document
+from ..database import single_writer
+from ..models.document import Document, content_hash
 from ..schemas.document import DocumentCreate, DocumentResponse
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+# Statements are defined once at module level and take their values as bind
+# parameters.
+SELECT_DOCUMENT = select(Document).where(Document.id == bindparam("document_id"))
+SELECT_DOCUMENT_ID = select(Document.id).where(Document.id == bindparam("document_id"))
+SELECT_DOCUMENT_BY_HASH = select(Document).where(Document.content_hash == bindparam("content_hash"))
+SELECT_ALL_DOCUMENTS = select(Document)
+SELECT_DOCUMENT_VERSION = (
+    select(Document.id, Document.created_at, Document.updated_at)
+    .where(Document.id == bindparam("document_id"))
+)
+
 
 class DocumentService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: "AsyncSession"):
         self.db = db
 
     async def create_document(self, document_data: DocumentCreate) -> DocumentResponse:
-        """Create a new document"""
+        """Create a new document, or return the existing one with identical content"""
+        document, _ = await self.get_or_create_document(document_data)
+        return document
+
+    async def get_or_create_document(self, document_data: DocumentCreate) -> Tuple[DocumentResponse, bool]:
+        """Create a document unless one with the same content hash exists
+
+        Returns the document and whether it was created. Duplicate uploads
+        resolve to the existing document (including its original title) with
+        a single indexed lookup and no write.
+        """
+        digest = content_hash(document_data.content)
         try:
-            document = Document(
-                title=document_data.title,
-                content=document_data.content
-            )
-            self.db.add(document)
-            await self.db.commit()
-            await self.db.refresh(document)
+            async with single_writer():
+                result = await self.db.execute(SELECT_DOCUMENT_BY_HASH, {"content_hash": digest})
+                existing = result.scalar_one_or_none()
+                
+                if existing:
+                    return DocumentResponse.from_record(existing), False
+                
+                document = Document(
+                    title=document_data.title,
+                    content=document_data.content,
+                    content_hash=digest
+                )
+                self.db.add(document)
+                await self.db.commit()
+                await self.db.refresh(document)
             
-            return DocumentResponse.from_orm(document)
+            return DocumentResponse.from_record(document), True
+        except IntegrityError:
+            # A concurrent upload of the same content committed first, unless
+            # some other constraint failed
+            await self.db.rollback()
+            result = await self.db.execute(SELECT_DOCUMENT_BY_HASH, {"content_hash": digest})
+            existing = result.scalar_one_or_none()
+            
+            if existing is None:
+                raise
+            return DocumentResponse.from_record(existing), False
         except Exception as e:
             await self.db.rollback()
             raise
@@ -29,35 +73,36 @@ class DocumentService:
     async def get_document(self, document_id: int) -> Optional[DocumentResponse]:
         """Get a document by ID"""
         try:
-            query = select(Document).where(Document.id == document_id)
-            result = await self.db.execute(query)
+            result = await self.db.execute(SELECT_DOCUMENT, {"document_id": document_id})
             document = result.scalar_one_or_none()
             
             if document:
-                return DocumentResponse.from_orm(document)
+                return DocumentResponse.from_record(document)
             else:
                 return None
         except Exception as e:
             raise
 
+    async def get_document_version(self, document_id: int):
+        """Get a document's id and timestamps without loading its content"""
+        result = await self.db.execute(SELECT_DOCUMENT_VERSION, {"document_id": document_id})
+        return result.one_or_none()
+
     async def get_all_documents(self) -> List[DocumentResponse]:
         """Get all documents"""
         try:
-            query = select(Document)
-            result = await self.db.execute(query)
+            result = await self.db.execute(SELECT_ALL_DOCUMENTS)
             documents = result.scalars().all()
             
-            return [DocumentResponse.from_orm(doc) for doc in documents]
+            return [DocumentResponse.from_record(doc) for doc in documents]
         except Exception as e:
             raise
 
     async def document_exists(self, document_id: int) -> bool:
         """Check if a document exists"""
         try:
-            query = select(Document).where(Document.id == document_id)
-            result = await self.db.execute(query)
-            document = result.scalar_one_or_none()
+            result = await self.db.execute(SELECT_DOCUMENT_ID, {"document_id": document_id})
             
-            return document is not None
+            return result.scalar_one_or_none() is not None
         except Exception as e:
             raise 
\ No newline at end of file
@@ -0,0 +1,254 @@
+from sqlalchemy import select, union_all, func, case, cast, bindparam, Float, DateTime
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Sequence
+from datetime import datetime, timezone
+import csv
+import io
+
+from ..config import settings
+from ..models.question import Question, QuestionStatus
+from ..models.question_archive import ArchivedQuestion
+from ..schemas.export import LatencyStats
+from pydantic_core import to_json
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+# Supported export formats and their media types
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+EXPORT_COLUMNS = [
+    "question_id",
+    "document_id",
+    "question",
+    "answer",
+    "created_at",
+    "answered_at",
+    "latency_seconds",
+]
+
+PERCENTILES = (50, 90, 99)
+
+
+class ExportService:
+    """Streams answered questions and aggregates answer latency in SQL"""
+
+    def __init__(self, db: "AsyncSession"):
+        self.db = db
+        self.dialect = db.get_bind().dialect.name
+
+    def _answers(self):
+        """Answered questions from the live table and the archive, as one subquery"""
+        live = select(
+            Question.id.label("question_id"),
+            Question.document_id,
+            Question.question,
+            Question.answer,
+            Question.created_at,
+            Question.updated_at.label("answered_at"),
+        ).where(Question.status == QuestionStatus.ANSWERED)
+        archived = select(
+            ArchivedQuestion.id.label("question_id"),
+            ArchivedQuestion.document_id,
+            ArchivedQuestion.question,
+            ArchivedQuestion.answer,
+            ArchivedQuestion.created_at,
+            ArchivedQuestion.answered_at,
+        )
+        return union_all(live, archived).subquery("answers")
+
+    def _latency_seconds(self, answers):
+        """Seconds from question creation to its answer, as a SQL expression"""
+        if self.dialect == "sqlite":
+            # julianday() is a float day count; round off its sub-millisecond error
+            days = func.julianday(answers.c.answered_at) - func.julianday(answers.c.created_at)
+            return func.round(days * 86400.0, 3)
+        return cast(func.extract("epoch", answers.c.answered_at - answers.c.created_at), Float)
+
+    def _answered_since(self, answers, since: Optional[datetime]):
+        """Filter for questions answered at or after ``since``"""
+        if since is None:
+            return answers.c.answered_at.is_not(None)
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        if self.dialect == "sqlite":
+            # SQLite stores naive UTC text without fractional seconds; normalize
+            # the bound value the same way so the comparison stays textual
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+            return answers.c.answered_at >= func.datetime(bindparam("since", since, type_=DateTime()))
+        return answers.c.answered_at >= since
+
+    def answers_query(self, document_id: Optional[int] = None, since: Optional[datetime] = None):
+        """Answered questions with their latency, ordered by answer time.
+
+        Both branches of the union are read in answer order from an index
+        (ix_questions_status_updated_at and ix_questions_archive_answered_at),
+        so a ``since`` watermark seeks instead of scanning and sorting.
+        """
+        answers = self._answers()
+        query = (
+            select(*answers.c, self._latency_seconds(answers).label("latency_seconds"))
+            .where(self._answered_since(answers, since))
+            .order_by(answers.c.answered_at, answers.c.question_id)
+        )
+        if document_id is not None:
+            query = query.where(answers.c.document_id == document_id)
+        return query
+
+    async def iter_answers(
+        self,
+        document_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+        batch_size: Optional[int] = None,
+    ) -> AsyncIterator[Sequence]:
+        """Yield batches of answered question rows ordered by answer time.
+
+        Includes questions moved to the archive by the retention job. Rows
+        are read through a server-side cursor, so memory use is bounded by
+        ``batch_size`` regardless of how many rows match. ``since`` is
+        inclusive: incremental exports may repeat rows answered exactly at the
+        previous watermark, so consumers should de-duplicate on question_id.
+        """
+        query = self.answers_query(document_id, since)
+        result = await self.db.stream(
+            query.execution_options(yield_per=batch_size or settings.export_batch_size)
+        )
+        async for rows in result.partitions():
+            yield rows
+
+    async def answer_latency_stats(
+        self,
+        document_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+    ) -> List[LatencyStats]:
+        """Answer latency percentiles per document, computed in the database.
+
+        Includes archived questions. Uses nearest-rank percentiles over window
+        functions, which both PostgreSQL and SQLite support.
+        """
+        answers = self._answers()
+        latency = self._latency_seconds(answers)
+        ranked = (
+            select(
+                answers.c.document_id,
+                latency.label("latency_seconds"),
+                func.row_number().over(partition_by=answers.c.document_id, order_by=latency).label("rank"),
+                func.count().over(partition_by=answers.c.document_id).label("total"),
+            )
+            .where(self._answered_since(answers, since))
+        )
+        if document_id is not None:
+            ranked = ranked.where(answers.c.document_id == document_id)
+        ranked = ranked.subquery()
+        
+        def percentile(p: int):
+            # Smallest latency whose rank reaches p% of the document's answers
+            return func.min(
+                case((ranked.c.rank * 100 >= ranked.c.total * p, ranked.c.latency_seconds))
+            ).label(f"p{p}_seconds")
+        
+        query = (
+            select(
+                ranked.c.document_id,
+                func.count().label("answered"),
+                func.avg(ranked.c.latency_seconds).label("mean_seconds"),
+                *(percentile(p) for p in PERCENTILES),
+            )
+            .group_by(ranked.c.document_id)
+            .order_by(ranked.c.document_id)
+        )
+        result = await self.db.execute(query)
+        
+        return [LatencyStats.from_record(row) for row in result]
+
+
+async def encode_answers(batches: AsyncIterator[Sequence], export_format: str) -> AsyncIterator[bytes]:
+    """Encode row batches from ExportService.iter_answers as NDJSON, CSV or Parquet"""
+    if export_format == "ndjson":
+        async for rows in batches:
+            yield b"".join(to_json(row._asdict()) + b"\n" for row in rows)
+    elif export_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        async for rows in batches:
+            writer.writerows(
+                [value.isoformat() if isinstance(value, datetime) else value for value in row]
+                for row in rows
+            )
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+    elif export_format == "parquet":
+        async for chunk in _encode_parquet(batches):
+            yield chunk
+    else:
+        raise ValueError(f"Unsupported export format '{export_format}'")
+
+
+def check_export_format(export_format: str):
+    """Raise ValueError if the format is unknown or its dependencies are missing"""
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported export format '{export_format}'; expected one of {', '.join(EXPORT_FORMATS)}"
+        )
+    if export_format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ValueError("Parquet export requires the optional 'pyarrow' package")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that hands written bytes back to the caller"""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _encode_parquet(batches: AsyncIterator[Sequence]) -> AsyncIterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    schema = pa.schema([
+        ("question_id", pa.int64()),
+        ("document_id", pa.int64()),
+        ("question", pa.string()),
+        ("answer", pa.string()),
+        ("created_at", pa.timestamp("us", tz="UTC")),
+        ("answered_at", pa.timestamp("us", tz="UTC")),
+        ("latency_seconds", pa.float64()),
+    ])
+    sink = _ChunkSink()
+    # One row group per fetched batch; only the footer is written at the end
+    with pq.ParquetWriter(sink, schema) as writer:
+        async for rows in batches:
+            columns = list(zip(*rows))
+            writer.write_table(pa.table(
+                [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+                schema=schema,
+            ))
+            yield sink.drain()
+    yield sink.drain()
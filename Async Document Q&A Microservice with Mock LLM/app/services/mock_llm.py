@@ -0,0 +1,213 @@
+from typing import NamedTuple, Optional
+from itertools import cycle, islice
+import asyncio
+import math
+import random
+import time
+
+from ..config import settings
+
+LATENCY_DISTRIBUTIONS = ("fixed", "lognormal", "bimodal")
+
+
+class MockLLMError(Exception):
+    """Injected backend failure"""
+    kind = "error"
+
+
+class MockLLMTimeout(MockLLMError):
+    """The backend did not answer within the timeout"""
+    kind = "timeout"
+
+
+class MockLLMRateLimited(MockLLMError):
+    """The shared tokens-per-minute budget is exhausted"""
+    kind = "rate_limited"
+
+
+class MockLLMCall(NamedTuple):
+    """Pre-drawn behaviour of one call"""
+    latency_seconds: float  # simulated time until the answer is complete
+    outcome: str  # "ok", "error" or "timeout"
+    output_tokens: int
+    wait_seconds: float  # time the caller waits: the latency, or the timeout for timeouts
+
+
+class _TokenBucket:
+    """Tokens-per-minute budget shared by all calls, refilled continuously"""
+
+    def __init__(self, tokens_per_minute: int, time_scale: float):
+        self.capacity = float(tokens_per_minute)
+        self.tokens = self.capacity
+        self.rate = tokens_per_minute / 60.0
+        self.time_scale = time_scale
+        self.updated = time.monotonic()
+
+    def try_acquire(self, tokens: int) -> bool:
+        now = time.monotonic()
+        # Refill in simulated time, so a compressed time scale refills faster
+        elapsed = (now - self.updated) / self.time_scale if self.time_scale > 0 else math.inf
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+        if tokens > self.tokens:
+            return False
+        self.tokens -= tokens
+        return True
+
+
+class MockLLM:
+    """Simulated LLM backend with seeded latency, failures and throughput limits.
+
+    Every call draws its latency and outcome from one ``random.Random``, so a
+    given seed reproduces the same sequence of calls. Latency is the sampled
+    base latency plus ``output_tokens / tokens_per_second``; calls whose
+    latency exceeds ``timeout_seconds`` time out, as do an extra
+    ``timeout_rate`` share of calls. Output length is proportional to the
+    context size. Tokens are approximated by whitespace-separated words.
+    """
+
+    def __init__(
+        self,
+        latency: str = "fixed",
+        latency_seconds: float = 5.0,
+        latency_sigma: float = 0.5,
+        slow_fraction: float = 0.1,
+        slow_latency_seconds: float = 30.0,
+        error_rate: float = 0.0,
+        timeout_rate: float = 0.0,
+        timeout_seconds: float = 60.0,
+        tokens_per_second: float = 0.0,
+        tokens_per_minute: int = 0,
+        output_ratio: float = 0.0,
+        max_output_tokens: int = 1024,
+        seed: Optional[int] = None,
+        time_scale: float = 1.0,
+    ):
+        if latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution '{latency}'; expected one of {', '.join(LATENCY_DISTRIBUTIONS)}"
+            )
+        # Lognormal modes are parameterized by the log of their median
+        if latency != "fixed" and latency_seconds <= 0:
+            raise ValueError(f"latency_seconds must be positive for '{latency}' latency, got {latency_seconds}")
+        if latency == "bimodal" and slow_latency_seconds <= 0:
+            raise ValueError(f"slow_latency_seconds must be positive, got {slow_latency_seconds}")
+        for name, rate in (
+            ("slow_fraction", slow_fraction),
+            ("error_rate", error_rate),
+            ("timeout_rate", timeout_rate),
+        ):
+            if not 0 <= rate <= 1:
+                raise ValueError(f"{name} must be between 0 and 1, got {rate}")
+        if error_rate + timeout_rate > 1:
+            raise ValueError("error_rate and timeout_rate must not add up to more than 1")
+        for name, value in (
+            ("latency_seconds", latency_seconds),
+            ("latency_sigma", latency_sigma),
+            ("timeout_seconds", timeout_seconds),
+            ("tokens_per_second", tokens_per_second),
+            ("tokens_per_minute", tokens_per_minute),
+            ("output_ratio", output_ratio),
+            ("max_output_tokens", max_output_tokens),
+            ("time_scale", time_scale),
+        ):
+            if value < 0:
+                raise ValueError(f"{name} must not be negative, got {value}")
+        self.latency = latency
+        self.latency_seconds = latency_seconds
+        self.latency_sigma = latency_sigma
+        self.slow_fraction = slow_fraction
+        self.slow_latency_seconds = slow_latency_seconds
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.timeout_seconds = timeout_seconds
+        self.tokens_per_second = tokens_per_second
+        self.output_ratio = output_ratio
+        self.max_output_tokens = max_output_tokens
+        self.time_scale = time_scale
+        self._random = random.Random(seed)
+        self._bucket = _TokenBucket(tokens_per_minute, time_scale) if tokens_per_minute > 0 else None
+
+    @classmethod
+    def from_settings(cls, **overrides) -> "MockLLM":
+        """Build a backend from the MOCK_LLM_* settings, with keyword overrides"""
+        options = dict(
+            latency=settings.mock_llm_latency,
+            latency_seconds=settings.mock_llm_latency_seconds,
+            latency_sigma=settings.mock_llm_latency_sigma,
+            slow_fraction=settings.mock_llm_slow_fraction,
+            slow_latency_seconds=settings.mock_llm_slow_latency_seconds,
+            error_rate=settings.mock_llm_error_rate,
+            timeout_rate=settings.mock_llm_timeout_rate,
+            timeout_seconds=settings.mock_llm_timeout_seconds,
+            tokens_per_second=settings.mock_llm_tokens_per_second,
+            tokens_per_minute=settings.mock_llm_tokens_per_minute,
+            output_ratio=settings.mock_llm_output_ratio,
+            max_output_tokens=settings.mock_llm_max_output_tokens,
+            seed=settings.mock_llm_seed,
+            time_scale=settings.mock_llm_time_scale,
+        )
+        options.update(overrides)
+        return cls(**options)
+
+    def _sample_latency(self) -> float:
+        if self.latency == "fixed":
+            return self.latency_seconds
+        if self.latency == "lognormal":
+            return self._random.lognormvariate(math.log(self.latency_seconds), self.latency_sigma)
+        # bimodal: a fast mode and a slow mode, each lognormal around its median
+        slow = self._random.random() < self.slow_fraction
+        median = self.slow_latency_seconds if slow else self.latency_seconds
+        return self._random.lognormvariate(math.log(median), self.latency_sigma)
+
+    def sample(self, context_tokens: int) -> MockLLMCall:
+        """Draw the behaviour of the next call without waiting"""
+        latency = self._sample_latency()
+        roll = self._random.random()
+        output_tokens = min(self.max_output_tokens, round(context_tokens * self.output_ratio))
+        if self.tokens_per_second > 0:
+            latency += output_tokens / self.tokens_per_second
+
+        if roll < self.timeout_rate or latency > self.timeout_seconds:
+            outcome = "timeout"
+        elif roll < self.timeout_rate + self.error_rate:
+            outcome = "error"
+        else:
+            outcome = "ok"
+        wait = self.timeout_seconds if outcome == "timeout" else latency
+        return MockLLMCall(latency, outcome, output_tokens, wait)
+
+    async def _sleep(self, seconds: float):
+        await asyncio.sleep(seconds * self.time_scale)
+
+    async def generate(self, question: str, context: str) -> str:
+        """Answer a question about ``context``, or raise a MockLLMError"""
+        context_words = context.split()
+        call = self.sample(len(context_words))
+
+        if self._bucket and not self._bucket.try_acquire(
+            len(context_words) + len(question.split()) + call.output_tokens
+        ):
+            raise MockLLMRateLimited("Token rate limit exceeded")
+
+        await self._sleep(call.wait_seconds)
+        if call.outcome == "timeout":
+            raise MockLLMTimeout(f"No response within {self.timeout_seconds}s")
+        if call.outcome == "error":
+            raise MockLLMError("Backend error")
+
+        answer = f"This is a generated answer to your question: {question}"
+        if call.output_tokens and context_words:
+            answer += " " + " ".join(islice(cycle(context_words), call.output_tokens))
+        return answer
+
+
+_mock_llm = None
+
+
+def get_mock_llm() -> MockLLM:
+    """Return the process-wide mock backend, configured from settings on first use"""
+    global _mock_llm
+    if _mock_llm is None:
+        _mock_llm = MockLLM.from_settings()
+    return _mock_llm
@@ -1,42 +1,88 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List, Optional
+from sqlalchemy import select, update, bindparam
+from typing import TYPE_CHECKING, List, Optional
+from collections import Counter
 import asyncio
+import logging
 
-from ..models.question import Question, QuestionStatus
+from ..config import settings
+from ..database import get_session_factory, single_writer
 from ..models.document import Document
+from ..models.question import Question, QuestionStatus
 from ..schemas.question import QuestionCreate, QuestionResponse
+from .document_service import SELECT_DOCUMENT_ID
+from .mock_llm import MockLLM, MockLLMError, MockLLMRateLimited, get_mock_llm
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+# Statements are defined once at module level and take their values as bind
+# parameters.
+SELECT_QUESTION = select(Question).where(Question.id == bindparam("question_id"))
+SELECT_QUESTION_VERSION = (
+    select(Question.id, Question.status, Question.created_at, Question.updated_at)
+    .where(Question.id == bindparam("question_id"))
+)
+SELECT_QUESTIONS_BY_DOCUMENT = (
+    select(Question)
+    .where(Question.document_id == bindparam("document_id"))
+    .order_by(Question.id)
+)
+SELECT_QUESTION_CONTEXT = (
+    select(Question.question, Document.content)
+    .join(Document, Document.id == Question.document_id)
+    .where(Question.id == bindparam("question_id"))
+)
+
+# Answering is a conditional update: only a question that is still pending is
+# claimed, so concurrent workers can never overwrite each other's answers.
+ANSWER_QUESTION = (
+    update(Question)
+    .where(Question.id == bindparam("question_id"), Question.status == QuestionStatus.PENDING)
+    .values(answer=bindparam("answer_text"), status=QuestionStatus.ANSWERED)
+    .execution_options(synchronize_session=False)
+)
+
+logger = logging.getLogger(__name__)
+
+# Failed mock LLM calls by kind ("error", "timeout", "rate_limited") since
+# the process started; reported by /health
+llm_failures = Counter()
+
+# Strong references to in-flight processing tasks; the event loop only keeps
+# weak ones, so an unreferenced task could be garbage collected mid-run.
+_background_tasks = set()
 
 
 class QuestionService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: "AsyncSession"):
         self.db = db
 
     async def create_question(self, document_id: int, question_data: QuestionCreate) -> QuestionResponse:
         """Create a new question and start async processing"""
         try:
-            # Check if document exists
-            doc_query = select(Document).where(Document.id == document_id)
-            doc_result = await self.db.execute(doc_query)
-            document = doc_result.scalar_one_or_none()
-            
-            if not document:
-                raise ValueError(f"Document with ID {document_id} not found")
-            
-            # Create question
-            question = Question(
-                document_id=document_id,
-                question=question_data.question,
-                status=QuestionStatus.PENDING
-            )
-            self.db.add(question)
-            await self.db.commit()
-            await self.db.refresh(question)
+            async with single_writer():
+                # Check if document exists
+                doc_result = await self.db.execute(SELECT_DOCUMENT_ID, {"document_id": document_id})
+                
+                if doc_result.scalar_one_or_none() is None:
+                    raise ValueError(f"Document with ID {document_id} not found")
+                
+                # Create question
+                question = Question(
+                    document_id=document_id,
+                    question=question_data.question,
+                    status=QuestionStatus.PENDING
+                )
+                self.db.add(question)
+                await self.db.commit()
+                await self.db.refresh(question)
             
             # Start async processing
-            asyncio.create_task(self._process_question_async(question.id))
+            task = asyncio.create_task(self._process_question_async(question.id))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
             
-            return QuestionResponse.from_orm(question)
+            return QuestionResponse.from_record(question)
         except Exception as e:
             await self.db.rollback()
             raise
@@ -44,68 +90,70 @@ class QuestionService:
     async def get_question(self, question_id: int) -> Optional[QuestionResponse]:
         """Get a question by ID"""
         try:
-            query = select(Question).where(Question.id == question_id)
-            result = await self.db.execute(query)
+            result = await self.db.execute(SELECT_QUESTION, {"question_id": question_id})
             question = result.scalar_one_or_none()
             
             if question:
-                return QuestionResponse.from_orm(question)
+                return QuestionResponse.from_record(question)
             else:
                 return None
         except Exception as e:
             raise
     
+    async def get_question_version(self, question_id: int):
+        """Get a question's id, status and timestamps without its text"""
+        result = await self.db.execute(SELECT_QUESTION_VERSION, {"question_id": question_id})
+        return result.one_or_none()
+    
     async def get_questions_by_document(self, document_id: int) -> List[QuestionResponse]:
         """Get all questions for a document"""
         try:
-            query = select(Question).where(Question.document_id == document_id)
-            result = await self.db.execute(query)
+            result = await self.db.execute(SELECT_QUESTIONS_BY_DOCUMENT, {"document_id": document_id})
             questions = result.scalars().all()
             
-            return [QuestionResponse.from_orm(q) for q in questions]
+            return [QuestionResponse.from_record(q) for q in questions]
         except Exception as e:
             raise
     
     async def _process_question_async(self, question_id: int):
-        """Simulate async LLM processing"""
+        """Answer a question with the mock LLM"""
         try:
-            # Simulate processing time (5 seconds as per requirements)
-            await asyncio.sleep(5)
+            # The request's session is closed once the response is sent, so
+            # the worker uses its own. It is released before generating, so
+            # slow answers do not hold pool connections.
+            session_factory = get_session_factory()
+            async with session_factory() as db:
+                result = await db.execute(SELECT_QUESTION_CONTEXT, {"question_id": question_id})
+                row = result.one_or_none()
             
-            # Get the question
-            query = select(Question).where(Question.id == question_id)
-            result = await self.db.execute(query)
-            question = result.scalar_one_or_none()
+            if row is None:
+                return
             
-            if question:
-                # Generate mock answer
-                mock_answer = f"This is a generated answer to your question: {question.question}"
-                
-                # Update question with answer
-                question.answer = mock_answer
-                question.status = QuestionStatus.ANSWERED
-                
-                await self.db.commit()
-            else:
-                # Try to update status to indicate error
-                try:
-                    query = select(Question).where(Question.id == question_id)
-                    result = await self.db.execute(query)
-                    question = result.scalar_one_or_none()
-                    if question:
-                        question.status = QuestionStatus.PENDING  # Keep as pending on error
-                        await self.db.commit()
-                except Exception as update_error:
-                    pass
-                
-        except Exception as e:
-            # Try to update status to indicate error
-            try:
-                query = select(Question).where(Question.id == question_id)
-                result = await self.db.execute(query)
-                question = result.scalar_one_or_none()
-                if question:
-                    question.status = QuestionStatus.PENDING  # Keep as pending on error
-                    await self.db.commit()
-            except Exception as update_error:
-                pass 
\ No newline at end of file
+            answer = await generate_answer(row.question, row.content)
+            
+            async with session_factory() as db:
+                async with single_writer():
+                    await db.execute(ANSWER_QUESTION, {"question_id": question_id, "answer_text": answer})
+                    await db.commit()
+        except MockLLMError as e:
+            # The question stays pending
+            logger.warning("Question %s was not answered: %s (%s)", question_id, e, e.kind)
+        except Exception:
+            logger.exception("Processing question %s failed", question_id)
+
+
+async def generate_answer(question: str, context: str, llm: Optional[MockLLM] = None) -> str:
+    """Ask the mock LLM, backing off exponentially while it is rate limited
+
+    Every failed call is counted in ``llm_failures``. Backoff waits follow
+    the backend's time scale, like its own latency.
+    """
+    llm = llm or get_mock_llm()
+    for attempt in range(settings.llm_rate_limit_retries + 1):
+        try:
+            return await llm.generate(question, context)
+        except MockLLMError as e:
+            llm_failures[e.kind] += 1
+            if not isinstance(e, MockLLMRateLimited) or attempt == settings.llm_rate_limit_retries:
+                raise
+        await asyncio.sleep(settings.llm_retry_backoff_seconds * 2 ** attempt * llm.time_scale)
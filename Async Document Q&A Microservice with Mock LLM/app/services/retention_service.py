@@ -0,0 +1,113 @@
+from sqlalchemy import select, insert, delete, bindparam
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+import asyncio
+import logging
+
+from ..cache import evict_question
+from ..config import settings
+from ..database import get_session_factory, single_writer
+from ..models.question import Question, QuestionStatus
+from ..models.question_archive import ArchivedQuestion
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Oldest answered questions first, served by ix_questions_status_created_at.
+# SKIP LOCKED lets archival jobs on several replicas take disjoint batches
+# (SQLite has no row locks and ignores the clause).
+SELECT_EXPIRED_QUESTION_IDS = (
+    select(Question.id)
+    .where(Question.status == QuestionStatus.ANSWERED, Question.created_at < bindparam("cutoff"))
+    .order_by(Question.created_at)
+    .limit(bindparam("batch_size"))
+    .with_for_update(skip_locked=True)
+)
+# Core insert on the table: an ORM insert would treat the bound ids as rows
+COPY_TO_ARCHIVE = insert(ArchivedQuestion.__table__).from_select(
+    ["id", "document_id", "question", "answer", "created_at", "answered_at"],
+    select(
+        Question.id,
+        Question.document_id,
+        Question.question,
+        Question.answer,
+        Question.created_at,
+        Question.updated_at,
+    ).where(Question.id.in_(bindparam("ids", expanding=True)))
+)
+DELETE_QUESTIONS = (
+    delete(Question)
+    .where(Question.id.in_(bindparam("ids", expanding=True)))
+    .execution_options(synchronize_session=False)
+)
+
+
+class RetentionService:
+    """Moves old answered questions to the archive table in bounded batches"""
+
+    def __init__(self, db: "AsyncSession"):
+        self.db = db
+
+    async def archive_batch(self, cutoff: datetime, batch_size: int) -> int:
+        """Archive up to ``batch_size`` answered questions created before ``cutoff``
+
+        Each batch is its own short transaction, so row locks (or SQLite's
+        write lock) are held only for one batch. Archived questions are
+        evicted from this process's response cache.
+        """
+        try:
+            async with single_writer():
+                result = await self.db.execute(
+                    SELECT_EXPIRED_QUESTION_IDS, {"cutoff": cutoff, "batch_size": batch_size}
+                )
+                ids = result.scalars().all()
+                
+                if ids:
+                    await self.db.execute(COPY_TO_ARCHIVE, {"ids": ids})
+                    await self.db.execute(DELETE_QUESTIONS, {"ids": ids})
+                await self.db.commit()
+            
+            for question_id in ids:
+                evict_question(question_id)
+            
+            return len(ids)
+        except Exception as e:
+            await self.db.rollback()
+            raise
+
+    async def archive_expired(
+        self,
+        retention_days: int = None,
+        batch_size: int = None,
+        pause_seconds: float = 0.1,
+    ) -> int:
+        """Archive every answered question older than the retention period
+
+        Pauses between batches so other writers are not starved.
+        Returns the number of archived questions.
+        """
+        retention_days = retention_days if retention_days is not None else settings.question_retention_days
+        batch_size = batch_size or settings.archive_batch_size
+        cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+        
+        total = 0
+        while True:
+            archived = await self.archive_batch(cutoff, batch_size)
+            total += archived
+            if archived < batch_size:
+                return total
+            await asyncio.sleep(pause_seconds)
+
+
+async def run_archival_job():
+    """Periodically archive expired questions until cancelled"""
+    while True:
+        try:
+            async with get_session_factory()() as db:
+                await RetentionService(db).archive_expired()
+        except Exception:
+            # Try again on the next run
+            logger.exception("Archiving expired questions failed")
+        await asyncio.sleep(settings.archive_interval_seconds)
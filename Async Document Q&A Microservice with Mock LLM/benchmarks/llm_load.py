@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Load simulator for the mock LLM backend
+
+Drives ``MockLLM`` with a fixed number of calls at a given concurrency and
+reports throughput, end-to-end latency percentiles and failure counts. A
+concurrency limit below the offered load queues calls behind the semaphore,
+which reproduces backpressure and the resulting tail latency. The backend is
+configured from the ``MOCK_LLM_*`` settings unless overridden here, and a
+seed makes runs repeatable. With ``--retry``, calls go through the question
+worker's ``generate_answer``, which backs off and retries rate-limited calls
+as the service does.
+
+Usage (from the project root):
+
+    python -m benchmarks.llm_load [--requests 500] [--concurrency 20] [--context-tokens 2000]
+        [--latency bimodal] [--seed 42] [--time-scale 0.01] [--retry]
+    python -m benchmarks.llm_load --sample [--requests 10000]
+"""
+import argparse
+import asyncio
+import math
+import sys
+import time
+from collections import Counter
+
+from app.services.mock_llm import LATENCY_DISTRIBUTIONS, MockLLM, MockLLMError
+from app.services.question_service import generate_answer, llm_failures
+
+OVERRIDES = (
+    "latency",
+    "latency_seconds",
+    "latency_sigma",
+    "slow_fraction",
+    "slow_latency_seconds",
+    "error_rate",
+    "timeout_rate",
+    "timeout_seconds",
+    "tokens_per_second",
+    "tokens_per_minute",
+    "output_ratio",
+    "max_output_tokens",
+    "seed",
+    "time_scale",
+)
+
+
+def percentile(values, fraction: float) -> float:
+    """Nearest-rank percentile of a sorted list"""
+    if not values:
+        return math.nan
+    return values[max(0, math.ceil(fraction * len(values)) - 1)]
+
+
+def report(latencies, outcomes: Counter, elapsed: float = None):
+    latencies.sort()
+    total = sum(outcomes.values())
+    if elapsed is not None:
+        print(f"calls {total}  elapsed {elapsed:.2f}s  throughput {outcomes['ok'] / elapsed:.1f} ok/s")
+    print("  ".join(f"{name} {outcomes[name]}" for name in ("ok", "error", "timeout", "rate_limited")))
+    print("latency (s)  " + "  ".join(
+        f"p{int(q * 100)} {percentile(latencies, q):.3f}" for q in (0.5, 0.9, 0.99)
+    ) + f"  max {latencies[-1] if latencies else math.nan:.3f}")
+
+
+async def call(llm: MockLLM, semaphore: asyncio.Semaphore, context: str, retry: bool, latencies, outcomes: Counter):
+    question = "What does the benchmark document say?"
+    started = time.perf_counter()
+    async with semaphore:
+        try:
+            if retry:
+                await generate_answer(question, context, llm)
+            else:
+                await llm.generate(question, context)
+            outcomes["ok"] += 1
+        except MockLLMError as e:
+            outcomes[e.kind] += 1
+    # Report in simulated seconds, including time spent queued
+    latencies.append((time.perf_counter() - started) / (llm.time_scale or 1))
+
+
+async def run(llm: MockLLM, requests: int, concurrency: int, context_tokens: int, retry: bool):
+    context = " ".join(f"word{i}" for i in range(context_tokens))
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, outcomes = [], Counter()
+    started = time.perf_counter()
+    await asyncio.gather(*(call(llm, semaphore, context, retry, latencies, outcomes) for _ in range(requests)))
+    report(latencies, outcomes, time.perf_counter() - started)
+    if retry:
+        print("failed attempts  " + "  ".join(f"{kind} {count}" for kind, count in sorted(llm_failures.items())))
+
+
+def sample(llm: MockLLM, requests: int, context_tokens: int):
+    """Print the configured distribution without waiting
+
+    Reports how long each caller would wait, so timeouts count as the full
+    timeout like in a live run.
+    """
+    calls = [llm.sample(context_tokens) for _ in range(requests)]
+    report([c.wait_seconds for c in calls], Counter(c.outcome for c in calls))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--context-tokens", type=int, default=2000)
+    parser.add_argument("--sample", action="store_true", help="Draw calls without sleeping and print the distribution")
+    parser.add_argument("--retry", action="store_true", help="Retry rate-limited calls like the question worker")
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS)
+    parser.add_argument("--latency-seconds", type=float)
+    parser.add_argument("--latency-sigma", type=float)
+    parser.add_argument("--slow-fraction", type=float)
+    parser.add_argument("--slow-latency-seconds", type=float)
+    parser.add_argument("--error-rate", type=float)
+    parser.add_argument("--timeout-rate", type=float)
+    parser.add_argument("--timeout-seconds", type=float)
+    parser.add_argument("--tokens-per-second", type=float)
+    parser.add_argument("--tokens-per-minute", type=int)
+    parser.add_argument("--output-ratio", type=float)
+    parser.add_argument("--max-output-tokens", type=int)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--time-scale", type=float)
+    args = parser.parse_args(argv)
+
+    overrides = {name: getattr(args, name) for name in OVERRIDES if getattr(args, name) is not None}
+    llm = MockLLM.from_settings(**overrides)
+
+    if args.sample:
+        sample(llm, args.requests, args.context_tokens)
+    else:
+        asyncio.run(run(llm, args.requests, args.concurrency, args.context_tokens, args.retry))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Serialization micro-benchmark for Async Document Q&A Microservice
+
+Compares CPU time per request for the previous response path
+(``from_orm`` in the service, then FastAPI ``response_model`` validation and
+JSON encoding) with the single-pass path (``from_record`` plus
+``ModelResponse``). Both endpoints serve the same in-memory ORM object, so
+no database is involved and the framework overhead is identical.
+
+Usage (from the project root):
+
+    python -m benchmarks.serialization [--requests 2000] [--sizes 1000 100000 1000000]
+"""
+import argparse
+import asyncio
+import sys
+import time
+import warnings
+from datetime import datetime, timezone
+
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.api.responses import ModelResponse
+from app.models import Document
+from app.schemas.document import DocumentResponse
+
+
+def build_app(document: Document) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/before", response_model=DocumentResponse)
+    async def before():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return DocumentResponse.from_orm(document)
+
+    @app.get("/after", response_model=DocumentResponse)
+    async def after():
+        return ModelResponse(DocumentResponse.from_record(document))
+
+    return app
+
+
+async def cpu_per_request(client: AsyncClient, path: str, requests: int) -> float:
+    """Return CPU microseconds per request for ``requests`` sequential calls"""
+    await client.get(path)  # warm up
+    started = time.process_time()
+    for _ in range(requests):
+        response = await client.get(path)
+        response.raise_for_status()
+    return (time.process_time() - started) / requests * 1_000_000
+
+
+async def run(requests: int, sizes):
+    print(f"{'content bytes':>14} {'before us/req':>14} {'after us/req':>13} {'saved':>7}")
+    for size in sizes:
+        document = Document(
+            id=1,
+            title="Benchmark document",
+            content="x" * size,
+            created_at=datetime.now(timezone.utc),
+            updated_at=None,
+        )
+        async with AsyncClient(app=build_app(document), base_url="http://bench") as client:
+            before = await cpu_per_request(client, "/before", requests)
+            after = await cpu_per_request(client, "/after", requests)
+        print(f"{size:14d} {before:14.1f} {after:13.1f} {1 - after / before:7.1%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    args = parser.parse_args(argv)
+    asyncio.run(run(args.requests, args.sizes))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Cold-start profiling for Async Document Q&A Microservice
+
+Usage (from the project root):
+
+    python -m benchmarks.startup imports [--top 25]
+        Import-time profile of ``app.main`` (wraps ``python -X importtime``).
+
+    python -m benchmarks.startup serve [--runs 5] [--budget-ms 300]
+        Spawns uvicorn and measures the time from process start to the first
+        successful ``GET /health``. Exits non-zero if the median exceeds the
+        budget. The database must already be migrated.
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Cold-start target. Not met yet: importing fastapi alone takes about 1s on a
+# small container (about 0.65s of it in fastapi.openapi.models), and measured
+# medians are 1.2-1.9s.
+DEFAULT_BUDGET_MS = 300
+
+
+def profile_imports(module: str = "app.main"):
+    """Return (module, self_us, cumulative_us) for every import of ``module``"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_request(timeout: float = 30.0) -> float:
+    """Start a server process and return milliseconds until /health answers"""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=PROJECT_ROOT,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError(f"Server exited with code {proc.returncode} before serving a request")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000
+            except OSError:
+                time.sleep(0.005)
+        raise TimeoutError(f"No response from {url} within {timeout}s")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    imports = commands.add_parser("imports", help="import-time profile of app.main")
+    imports.add_argument("--top", type=int, default=25, help="number of modules to show")
+    imports.add_argument("--module", default="app.main")
+
+    serve = commands.add_parser("serve", help="time from process start to first served request")
+    serve.add_argument("--runs", type=int, default=5)
+    serve.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "imports":
+        rows = profile_imports(args.module)
+        total = next(cumulative for name, _, cumulative in rows if name == args.module)
+        print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for name, self_us, cumulative_us in sorted(rows, key=lambda row: row[2], reverse=True)[:args.top]:
+            print(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {name}")
+        print(f"\nimport {args.module}: {total / 1000:.1f} ms")
+        return 0
+
+    samples = [time_to_first_request() for _ in range(args.runs)]
+    median = statistics.median(samples)
+    print("runs (ms): " + ", ".join(f"{sample:.0f}" for sample in samples))
+    print(f"median time to first request: {median:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    return 0 if median <= args.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """
 Database creation script for Async Document Q&A Microservice
+
+Reads the target database from DATABASE_URL (see app/config.py). SQLite
+databases need no creation step; the file is created on first connection.
 """
 import asyncio
-import asyncpg
 import logging
+from sqlalchemy.engine import make_url
+from app.config import settings
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -13,36 +17,44 @@ logger = logging.getLogger(__name__)
 
 async def create_database():
     """Create the database if it doesn't exist"""
+    url = make_url(settings.database_url)
+    
+    if url.get_backend_name() == "sqlite":
+        logger.info(f"SQLite database '{url.database}' is created on first connection")
+        return
+    
+    import asyncpg
+    
     try:
         # Connect to default postgres database
         conn = await asyncpg.connect(
-            user='postgres',
-            password='sairaj',
-            host='localhost',
-            port=5432,
+            user=url.username,
+            password=url.password,
+            host=url.host or 'localhost',
+            port=url.port or 5432,
             database='postgres'
         )
         
         # Check if database exists
         result = await conn.fetchval(
             "SELECT 1 FROM pg_database WHERE datname = $1",
-            'document_qa'
+            url.database
         )
         
         if not result:
             # Create database
-            await conn.execute('CREATE DATABASE document_qa')
-            logger.info("Database 'document_qa' created successfully!")
+            await conn.execute(f'CREATE DATABASE "{url.database}"')
+            logger.info(f"Database '{url.database}' created successfully!")
         else:
-            logger.info("Database 'document_qa' already exists!")
+            logger.info(f"Database '{url.database}' already exists!")
         
         await conn.close()
         
     except Exception as e:
         logger.error(f"Error creating database: {e}")
-        logger.info("Please make sure PostgreSQL is running and password is correct.")
+        logger.info("Please make sure PostgreSQL is running and DATABASE_URL credentials are correct.")
         raise
 
 
 if __name__ == "__main__":
-    asyncio.run(create_database()) 
\ No newline at end of file
+    asyncio.run(create_database())
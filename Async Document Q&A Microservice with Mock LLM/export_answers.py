@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Answer history export script for Async Document Q&A Microservice
+
+Streams answered questions to NDJSON, CSV or Parquet in constant memory.
+With --watermark-file, each run starts at the last answer time exported by
+the previous run, which makes it suitable for a daily cron job:
+
+    python export_answers.py --format ndjson --output answers-$(date +%F).ndjson \\
+        --watermark-file exports/answers.watermark
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from datetime import datetime
+
+from app.database import get_session_factory, dispose_engine
+from app.services.export_service import ExportService, check_export_format, encode_answers
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def read_watermark(path: str):
+    if not path or not os.path.exists(path):
+        return None
+    with open(path) as f:
+        value = f.read().strip()
+    return datetime.fromisoformat(value) if value else None
+
+
+def write_watermark(path: str, watermark: datetime):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(watermark.isoformat())
+    os.replace(tmp_path, path)
+
+
+async def export(args):
+    since = datetime.fromisoformat(args.since) if args.since else read_watermark(args.watermark_file)
+    watermark = since
+    exported = 0
+    
+    async def tracked(batches):
+        nonlocal watermark, exported
+        async for rows in batches:
+            exported += len(rows)
+            watermark = rows[-1].answered_at
+            yield rows
+    
+    output = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    try:
+        async with get_session_factory()() as db:
+            batches = ExportService(db).iter_answers(
+                document_id=args.document_id,
+                since=since,
+                batch_size=args.batch_size
+            )
+            async for chunk in encode_answers(tracked(batches), args.format):
+                output.write(chunk)
+    finally:
+        if output is not sys.stdout.buffer:
+            output.close()
+        await dispose_engine()
+    
+    logger.info(f"Exported {exported} answered questions (since {since.isoformat() if since else 'the beginning'})")
+    if args.watermark_file and watermark is not None:
+        write_watermark(args.watermark_file, watermark)
+        logger.info(f"Next export starts at {watermark.isoformat()}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--format", default="ndjson", help="ndjson, csv or parquet")
+    parser.add_argument("--output", default="-", help="output file, '-' for stdout")
+    parser.add_argument("--document-id", type=int, default=None)
+    parser.add_argument("--since", default=None, help="ISO timestamp; overrides the watermark file")
+    parser.add_argument("--watermark-file", default=None, help="file holding the last exported answer time")
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args(argv)
+    
+    try:
+        check_export_format(args.format)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    asyncio.run(export(args))
+
+
+if __name__ == "__main__":
+    main()
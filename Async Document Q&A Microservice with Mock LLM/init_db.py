@@ -1,22 +1,26 @@
 #!/usr/bin/env python3
 """
 Database initialization script for Async Document Q&A Microservice
+
+Applies all pending Alembic migrations (equivalent to ``alembic upgrade head``).
 """
-import asyncio
 import logging
-from app.database import init_db
-from app.config import settings
+import os
+from alembic import command
+from alembic.config import Config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini")
+
 
-async def main():
+def main():
     """Initialize the database"""
     try:
-        logger.info("Initializing database...")
-        await init_db()
+        logger.info("Applying database migrations...")
+        command.upgrade(Config(ALEMBIC_INI), "head")
         logger.info("Database initialized successfully!")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
@@ -24,4 +28,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    main()
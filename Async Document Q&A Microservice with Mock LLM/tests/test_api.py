@@ -1,23 +1,37 @@
+import asyncio
 import pytest
+from datetime import datetime, timedelta
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.main import app
-from app.database import get_db
+from app.database import get_db, dispose_engine
 from app.models import Document, Question
+from app.models.question import QuestionStatus
+from app.cache import response_cache
+from app.config import settings
+from app.services import mock_llm
+from app.services.question_service import _background_tasks, llm_failures
 
 
 @pytest.fixture
-async def async_client():
+async def async_client(database):
     """Create async client for testing"""
     async with AsyncClient(app=app, base_url="http://test") as client:
         yield client
+    
+    tasks = list(_background_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await dispose_engine()
 
 
 @pytest.fixture
-async def db_session():
+async def db_session(database):
     """Create database session for testing"""
     async for session in get_db():
         yield session
+    await dispose_engine()
 
 
 @pytest.mark.asyncio
@@ -59,6 +73,54 @@ async def test_create_document(async_client):
     assert "created_at" in data
 
 
+@pytest.mark.asyncio
+async def test_timestamps_are_utc(async_client):
+    """Test that timestamps carry a UTC offset on every backend"""
+    create_doc_response = await async_client.post(
+        "/documents/",
+        json={"title": "Timestamps", "content": "This document has timestamps."}
+    )
+    created_doc = create_doc_response.json()
+    
+    create_q_response = await async_client.post(
+        f"/questions/{created_doc['id']}/question",
+        json={"question": "When was this asked?"}
+    )
+    created_question = create_q_response.json()
+    
+    document = (await async_client.get(f"/documents/{created_doc['id']}")).json()
+    question = (await async_client.get(f"/questions/{created_question['id']}")).json()
+    for timestamp in (created_doc["created_at"], document["created_at"], question["created_at"]):
+        assert datetime.fromisoformat(timestamp).utcoffset() == timedelta(0)
+
+
+@pytest.mark.asyncio
+async def test_create_duplicate_document(async_client):
+    """Test that re-uploading identical content returns the existing document"""
+    document_data = {
+        "title": "Original Title",
+        "content": "This content is uploaded twice."
+    }
+    
+    first = await async_client.post("/documents/", json=document_data)
+    assert first.status_code == 201
+    
+    second = await async_client.post(
+        "/documents/",
+        json={"title": "Another Title", "content": document_data["content"]}
+    )
+    assert second.status_code == 200
+    assert second.json()["id"] == first.json()["id"]
+    assert second.json()["title"] == "Original Title"
+    
+    different = await async_client.post(
+        "/documents/",
+        json={"title": "Original Title", "content": "This content is different."}
+    )
+    assert different.status_code == 201
+    assert different.json()["id"] != first.json()["id"]
+
+
 @pytest.mark.asyncio
 async def test_get_document(async_client):
     """Test document retrieval"""
@@ -172,4 +234,162 @@ async def test_create_question_for_nonexistent_document(async_client):
 async def test_get_nonexistent_question(async_client):
     """Test retrieving non-existent question"""
     response = await async_client.get("/questions/99999")
-    assert response.status_code == 404 
\ No newline at end of file
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_document_conditional(async_client):
+    """Test ETag and If-None-Match handling for documents"""
+    document_data = {
+        "title": "Test Document for Caching",
+        "content": "This is a test document for conditional requests."
+    }
+    
+    create_response = await async_client.post("/documents/", json=document_data)
+    assert create_response.status_code == 201
+    created_doc = create_response.json()
+    
+    response = await async_client.get(f"/documents/{created_doc['id']}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "no-cache"
+    
+    response = await async_client.get(
+        f"/documents/{created_doc['id']}",
+        headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    
+    response = await async_client.get(
+        f"/documents/{created_doc['id']}",
+        headers={"If-None-Match": '"stale"'}
+    )
+    assert response.status_code == 200
+    assert response.json()["content"] == document_data["content"]
+
+
+@pytest.mark.asyncio
+async def test_get_pending_question_conditional(async_client):
+    """Test that pending questions must be revalidated"""
+    document_data = {
+        "title": "Test Document for Question Caching",
+        "content": "This is a test document for question caching."
+    }
+    
+    create_doc_response = await async_client.post("/documents/", json=document_data)
+    created_doc = create_doc_response.json()
+    
+    create_q_response = await async_client.post(
+        f"/questions/{created_doc['id']}/question",
+        json={"question": "Is this cached?"}
+    )
+    created_question = create_q_response.json()
+    
+    response = await async_client.get(f"/questions/{created_question['id']}")
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+    assert response.headers["cache-control"] == "no-cache"
+    etag = response.headers["etag"]
+    
+    response = await async_client.get(
+        f"/questions/{created_question['id']}",
+        headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_question_is_answered(async_client, monkeypatch):
+    """Test that the background worker answers a question with the mock LLM"""
+    monkeypatch.setattr(mock_llm, "_mock_llm", mock_llm.MockLLM(latency_seconds=0))
+    
+    create_doc_response = await async_client.post(
+        "/documents/",
+        json={"title": "Answered Document", "content": "This document gets answered."}
+    )
+    created_doc = create_doc_response.json()
+    
+    create_q_response = await async_client.post(
+        f"/questions/{created_doc['id']}/question",
+        json={"question": "Will this be answered?"}
+    )
+    created_question = create_q_response.json()
+    
+    for _ in range(50):
+        response = await async_client.get(f"/questions/{created_question['id']}")
+        if response.json()["status"] == "answered":
+            break
+        await asyncio.sleep(0.05)
+    
+    data = response.json()
+    assert data["status"] == "answered"
+    assert data["answer"] == "This is a generated answer to your question: Will this be answered?"
+
+
+@pytest.mark.asyncio
+async def test_failed_answer_is_reported(async_client, monkeypatch):
+    """Test that a failed mock LLM call leaves the question pending and is counted"""
+    monkeypatch.setattr(mock_llm, "_mock_llm", mock_llm.MockLLM(latency_seconds=0, error_rate=1.0))
+    llm_failures.clear()
+    
+    create_doc_response = await async_client.post(
+        "/documents/",
+        json={"title": "Failing Document", "content": "This document is never answered."}
+    )
+    created_doc = create_doc_response.json()
+    
+    create_q_response = await async_client.post(
+        f"/questions/{created_doc['id']}/question",
+        json={"question": "Will this fail?"}
+    )
+    created_question = create_q_response.json()
+    
+    for _ in range(50):
+        if not _background_tasks:
+            break
+        await asyncio.sleep(0.05)
+    
+    response = await async_client.get(f"/questions/{created_question['id']}")
+    assert response.json()["status"] == "pending"
+    
+    response = await async_client.get("/health")
+    assert response.json()["llm_failures"] == {"error": 1}
+
+
+@pytest.mark.asyncio
+async def test_get_answered_question_cached(async_client, db_session):
+    """Test that answered questions are served from the LRU as immutable"""
+    document = Document(title="Cached Answer", content="This document has an answered question.")
+    db_session.add(document)
+    await db_session.flush()
+    question = Question(
+        document_id=document.id,
+        question="Is this cached?",
+        answer="Yes",
+        status=QuestionStatus.ANSWERED,
+    )
+    db_session.add(question)
+    await db_session.commit()
+    
+    first = await async_client.get(f"/questions/{question.id}")
+    assert first.status_code == 200
+    assert response_cache.get(("question", question.id)) is not None
+    
+    # The database row is gone, so the second response can only come from the cache
+    await db_session.delete(question)
+    await db_session.commit()
+    
+    second = await async_client.get(f"/questions/{question.id}")
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.headers["cache-control"] == (
+        f"public, max-age={settings.answered_question_max_age}, immutable"
+    )
+    
+    response = await async_client.get(
+        f"/questions/{question.id}",
+        headers={"If-None-Match": first.headers["etag"]}
+    )
+    assert response.status_code == 304
@@ -0,0 +1,68 @@
+from app.api.caching import etag_matches, make_etag, question_cache_control
+from app.cache import LRUCache
+from app.models.question import QuestionStatus
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """Test that reading an entry protects it from eviction"""
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_cache_disabled_with_zero_size():
+    """Test that a zero-sized cache stores nothing"""
+    cache = LRUCache(maxsize=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+
+
+def test_lru_cache_bounded_by_bytes():
+    """Test that the byte limit evicts old entries and skips oversized ones"""
+    cache = LRUCache(maxsize=10, maxbytes=100)
+    cache.put("a", b"a", 60)
+    cache.put("b", b"b", 30)
+    cache.put("c", b"c", 30)
+
+    assert cache.get("a") is None
+    assert cache.nbytes == 60
+
+    cache.put("big", b"big", 101)
+    assert cache.get("big") is None
+    assert cache.get("b") == b"b"
+
+    cache.put("b", b"b2", 10)
+    cache.pop("c")
+    assert cache.nbytes == 10
+
+
+def test_etag_is_stable_and_version_sensitive():
+    """Test that ETags only change when the version changes"""
+    assert make_etag("document", 1, "v1") == make_etag("document", 1, "v1")
+    assert make_etag("document", 1, "v1") != make_etag("document", 1, "v2")
+    assert make_etag("document", 1, "v1") != make_etag("question", 1, "v1")
+
+
+def test_etag_matches_if_none_match_forms():
+    """Test list, wildcard and weak forms of If-None-Match"""
+    etag = make_etag("document", 1)
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches(f"W/{etag}", etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_only_answered_questions_are_publicly_cacheable():
+    """Test Cache-Control for answered and pending questions"""
+    assert "immutable" in question_cache_control(QuestionStatus.ANSWERED)
+    assert question_cache_control(QuestionStatus.PENDING) == "no-cache"
@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+
+from app.database import get_session_factory, dispose_engine
+from app.models import Document
+from app.models.document import content_hash
+from app.schemas.document import DocumentCreate
+from app.services.document_service import DocumentService
+
+CONTENT = "Uploaded by two clients at once."
+
+
+class RacingSession:
+    """Session wrapper that runs ``race`` right after the first query"""
+
+    def __init__(self, db, race):
+        self.db = db
+        self.race = race
+
+    def __getattr__(self, name):
+        return getattr(self.db, name)
+
+    async def execute(self, *args, **kwargs):
+        result = await self.db.execute(*args, **kwargs)
+        if self.race:
+            race, self.race = self.race, None
+            await race()
+        return result
+
+
+@pytest.fixture
+async def session(database):
+    async with get_session_factory()() as db:
+        yield db
+    await dispose_engine()
+
+
+async def insert_concurrently():
+    """Commit the same content from another session"""
+    async with get_session_factory()() as other:
+        other.add(Document(title="Winner", content=CONTENT, content_hash=content_hash(CONTENT)))
+        await other.commit()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicate_returns_winner(session):
+    """Test that losing the insert race returns the document that won"""
+    service = DocumentService(RacingSession(session, insert_concurrently))
+    
+    document, created = await service.get_or_create_document(DocumentCreate(title="Loser", content=CONTENT))
+    
+    assert created is False
+    assert document.title == "Winner"
+    count = await session.execute(select(func.count()).select_from(Document))
+    assert count.scalar_one() == 1
+
+
+@pytest.mark.asyncio
+async def test_other_integrity_errors_are_raised(session):
+    """Test that a constraint failure other than a duplicate hash is not hidden"""
+    service = DocumentService(session)
+    
+    with pytest.raises(IntegrityError):
+        await service.get_or_create_document(DocumentCreate.model_construct(title=None, content=CONTENT))
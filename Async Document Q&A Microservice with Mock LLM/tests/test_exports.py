@@ -0,0 +1,139 @@
+import csv
+import io
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from httpx import AsyncClient
+
+from app.main import app
+from app.database import get_session_factory, dispose_engine
+from app.models import Document, Question
+from app.models.question import QuestionStatus
+from app.services.export_service import ExportService
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+async def seeded(database):
+    """Two documents: one with answers taking 1..10 seconds, one with a single 3 second answer"""
+    async with get_session_factory()() as db:
+        first = Document(title="First", content="First document")
+        second = Document(title="Second", content="Second document")
+        db.add_all([first, second])
+        await db.flush()
+        
+        for seconds in range(1, 11):
+            db.add(Question(
+                document_id=first.id,
+                question=f"Question {seconds}",
+                answer=f"Answer {seconds}",
+                status=QuestionStatus.ANSWERED,
+                created_at=START,
+                updated_at=START + timedelta(seconds=seconds),
+            ))
+        db.add(Question(
+            document_id=second.id,
+            question="Question",
+            answer="Answer",
+            status=QuestionStatus.ANSWERED,
+            created_at=START,
+            updated_at=START + timedelta(seconds=3),
+        ))
+        db.add(Question(document_id=second.id, question="Unanswered", status=QuestionStatus.PENDING))
+        await db.commit()
+        ids = (first.id, second.id)
+    
+    yield ids
+    await dispose_engine()
+
+
+@pytest.fixture
+async def async_client(seeded):
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_streams_answered_questions_in_answer_order(async_client, seeded):
+    """Test NDJSON export contents, ordering and latency"""
+    response = await async_client.get("/exports/answers", params={"format": "ndjson"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 11
+    assert all(row["answer"] for row in rows)
+    assert [row["latency_seconds"] for row in rows] == pytest.approx([1, 2, 3, 3, 4, 5, 6, 7, 8, 9, 10])
+    assert datetime.fromisoformat(rows[0]["answered_at"]) == START + timedelta(seconds=1)
+
+
+@pytest.mark.asyncio
+async def test_export_csv_with_document_filter(async_client, seeded):
+    """Test CSV export for a single document"""
+    first_id, second_id = seeded
+    response = await async_client.get(
+        "/exports/answers",
+        params={"format": "csv", "document_id": second_id}
+    )
+    assert response.status_code == 200
+    
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["question"] == "Question"
+    assert float(rows[0]["latency_seconds"]) == pytest.approx(3)
+
+
+@pytest.mark.asyncio
+async def test_export_is_incremental_from_watermark(async_client, seeded):
+    """Test that since is an inclusive lower bound on answer time"""
+    response = await async_client.get(
+        "/exports/answers",
+        params={"since": (START + timedelta(seconds=8)).isoformat()}
+    )
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["question"] for row in rows] == ["Question 8", "Question 9", "Question 10"]
+
+
+@pytest.mark.asyncio
+async def test_export_parquet(async_client, seeded):
+    """Test Parquet export round trip"""
+    pq = pytest.importorskip("pyarrow.parquet")
+    response = await async_client.get("/exports/answers", params={"format": "parquet"})
+    assert response.status_code == 200
+    
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.num_rows == 11
+    assert table.column_names[0] == "question_id"
+
+
+@pytest.mark.asyncio
+async def test_export_rejects_unknown_format(async_client):
+    """Test unsupported export format"""
+    response = await async_client.get("/exports/answers", params={"format": "xml"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_latency_percentiles_computed_per_document(async_client, seeded):
+    """Test nearest-rank latency percentiles per document"""
+    first_id, second_id = seeded
+    response = await async_client.get("/exports/latency")
+    assert response.status_code == 200
+    
+    stats = {row["document_id"]: row for row in response.json()}
+    assert stats[first_id]["answered"] == 10
+    assert stats[first_id]["mean_seconds"] == pytest.approx(5.5)
+    assert stats[first_id]["p50_seconds"] == pytest.approx(5)
+    assert stats[first_id]["p90_seconds"] == pytest.approx(9)
+    assert stats[first_id]["p99_seconds"] == pytest.approx(10)
+    assert stats[second_id]["answered"] == 1
+    assert stats[second_id]["p99_seconds"] == pytest.approx(3)
+
+
+@pytest.mark.asyncio
+async def test_iter_answers_yields_bounded_batches(seeded):
+    """Test that rows are fetched in batches of at most batch_size"""
+    async with get_session_factory()() as db:
+        sizes = [len(rows) async for rows in ExportService(db).iter_answers(batch_size=4)]
+    assert sizes == [4, 4, 3]
@@ -0,0 +1,76 @@
+import asyncio
+import os
+import pytest
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.database import SCHEMA_REVISION, dispose_engine, verify_schema
+from app.models.document import content_hash
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(__file__)), "alembic.ini")
+
+
+async def execute(url, statement, fetch=False):
+    engine = create_async_engine(url)
+    try:
+        async with engine.begin() as conn:
+            result = await conn.execute(text(statement))
+            return result.all() if fetch else None
+    finally:
+        await engine.dispose()
+
+
+def check_schema():
+    """Run the startup schema check on a fresh engine"""
+    async def run():
+        try:
+            await verify_schema()
+        finally:
+            await dispose_engine()
+    
+    asyncio.run(run())
+
+
+def test_schema_revision_matches_migration_head():
+    """Test that startup verification expects the latest migration"""
+    script = ScriptDirectory.from_config(Config(ALEMBIC_INI))
+    assert script.get_heads() == [SCHEMA_REVISION]
+
+
+def test_content_hash_backfill_keeps_oldest_duplicate(database):
+    """Test that 0003 hashes existing documents and tolerates duplicates"""
+    config = Config(ALEMBIC_INI)
+    command.downgrade(config, "0002")
+    
+    asyncio.run(execute(
+        database,
+        "INSERT INTO documents (title, content) VALUES ('a', 'same'), ('b', 'same'), ('c', 'other')"
+    ))
+    command.upgrade(config, "head")
+    
+    rows = asyncio.run(execute(database, "SELECT title, content_hash FROM documents ORDER BY id", fetch=True))
+    assert rows == [("a", content_hash("same")), ("b", None), ("c", content_hash("other"))]
+
+
+def test_verify_schema_at_head(database):
+    """Test that startup accepts a database migrated to head"""
+    check_schema()
+
+
+def test_verify_schema_behind_head(database):
+    """Test that startup refuses a database that is one migration behind"""
+    command.downgrade(Config(ALEMBIC_INI), "-1")
+    
+    with pytest.raises(RuntimeError, match="run 'alembic upgrade head'"):
+        check_schema()
+
+
+def test_verify_schema_unmigrated(database):
+    """Test that startup refuses a database without an alembic_version table"""
+    command.downgrade(Config(ALEMBIC_INI), "base")
+    asyncio.run(execute(database, "DROP TABLE alembic_version"))
+    
+    with pytest.raises(RuntimeError, match="revision None"):
+        check_schema()
@@ -0,0 +1,171 @@
+import statistics
+import pytest
+
+from app.config import settings
+from app.services.mock_llm import MockLLM, MockLLMError, MockLLMRateLimited, MockLLMTimeout
+from app.services.question_service import generate_answer, llm_failures
+from benchmarks import llm_load
+
+CONTEXT = " ".join(f"word{i}" for i in range(1000))
+
+
+def test_same_seed_same_calls():
+    """Test that a seed reproduces the same sequence of calls"""
+    options = dict(latency="bimodal", error_rate=0.1, timeout_rate=0.05, seed=7)
+    a, b = MockLLM(**options), MockLLM(**options)
+    assert [a.sample(100) for _ in range(200)] == [b.sample(100) for _ in range(200)]
+
+
+@pytest.mark.parametrize("options", [
+    dict(latency="uniform"),
+    dict(latency="lognormal", latency_seconds=0),
+    dict(latency="bimodal", slow_latency_seconds=0),
+    dict(latency_seconds=-1),
+    dict(error_rate=1.5),
+    dict(timeout_rate=-0.1),
+    dict(error_rate=0.6, timeout_rate=0.6),
+    dict(slow_fraction=2),
+    dict(time_scale=-1),
+    dict(tokens_per_minute=-1),
+])
+def test_invalid_options(options):
+    """Test that invalid configurations are rejected up front"""
+    with pytest.raises(ValueError):
+        MockLLM(**options)
+
+
+def test_lognormal_median():
+    """Test that lognormal latency is centred on the configured median"""
+    llm = MockLLM(latency="lognormal", latency_seconds=2.0, latency_sigma=0.5, seed=1)
+    latencies = [llm.sample(0).latency_seconds for _ in range(5000)]
+    assert statistics.median(latencies) == pytest.approx(2.0, rel=0.05)
+    assert max(latencies) > 4.0
+
+
+def test_bimodal_slow_fraction():
+    """Test that the slow mode receives the configured share of calls"""
+    llm = MockLLM(
+        latency="bimodal",
+        latency_seconds=1.0,
+        slow_latency_seconds=30.0,
+        latency_sigma=0.1,
+        slow_fraction=0.2,
+        seed=1,
+    )
+    latencies = [llm.sample(0).latency_seconds for _ in range(5000)]
+    slow = sum(1 for latency in latencies if latency > 10)
+    assert slow / len(latencies) == pytest.approx(0.2, abs=0.02)
+
+
+def test_failure_rates():
+    """Test that errors and timeouts are injected at the configured rates"""
+    llm = MockLLM(error_rate=0.1, timeout_rate=0.05, seed=1)
+    outcomes = [llm.sample(0).outcome for _ in range(10000)]
+    assert outcomes.count("error") / len(outcomes) == pytest.approx(0.1, abs=0.01)
+    assert outcomes.count("timeout") / len(outcomes) == pytest.approx(0.05, abs=0.01)
+
+
+def test_output_proportional_to_context():
+    """Test that output length and generation time follow the context size"""
+    llm = MockLLM(latency_seconds=1.0, output_ratio=0.1, max_output_tokens=50, tokens_per_second=10)
+    assert llm.sample(200).output_tokens == 20
+    assert llm.sample(200).latency_seconds == pytest.approx(3.0)
+    assert llm.sample(10000).output_tokens == 50
+
+
+def test_slow_calls_time_out():
+    """Test that calls slower than the timeout are reported as timeouts"""
+    llm = MockLLM(latency_seconds=10.0, timeout_seconds=5.0)
+    call = llm.sample(0)
+    assert call.outcome == "timeout"
+    assert call.wait_seconds == 5.0
+
+
+def test_timeouts_wait_for_the_timeout():
+    """Test that every timeout, injected or slow, waits exactly the timeout"""
+    llm = MockLLM(latency="bimodal", timeout_rate=0.1, timeout_seconds=20.0, seed=1)
+    calls = [llm.sample(0) for _ in range(2000)]
+    timeouts = [c for c in calls if c.outcome == "timeout"]
+    
+    assert any(c.latency_seconds < 20.0 for c in timeouts)
+    assert any(c.latency_seconds > 20.0 for c in timeouts)
+    assert all(c.wait_seconds == 20.0 for c in timeouts)
+    assert all(c.wait_seconds == c.latency_seconds for c in calls if c.outcome != "timeout")
+
+
+def test_sample_mode_reports_live_waits(capsys):
+    """Test that the load benchmark's --sample tail never exceeds the timeout"""
+    llm_load.main(["--sample", "--latency", "bimodal", "--seed", "1", "--requests", "5000"])
+    
+    latency_line = capsys.readouterr().out.splitlines()[-1]
+    assert float(latency_line.split("max ")[1]) == pytest.approx(60.0)
+
+
+@pytest.mark.asyncio
+async def test_generate_default_answer():
+    """Test that the default answer text is unchanged"""
+    llm = MockLLM(latency_seconds=0)
+    answer = await llm.generate("What is this?", CONTEXT)
+    assert answer == "This is a generated answer to your question: What is this?"
+
+
+@pytest.mark.asyncio
+async def test_generate_output_length():
+    """Test that generated output grows with the context"""
+    llm = MockLLM(latency_seconds=0, output_ratio=0.05)
+    answer = await llm.generate("What is this?", CONTEXT)
+    assert len(answer.split()) == len("This is a generated answer to your question: What is this?".split()) + 50
+
+
+@pytest.mark.asyncio
+async def test_generate_failures():
+    """Test that injected errors and timeouts are raised"""
+    with pytest.raises(MockLLMError):
+        await MockLLM(latency_seconds=0, error_rate=1.0).generate("Q", CONTEXT)
+    
+    with pytest.raises(MockLLMTimeout):
+        await MockLLM(latency_seconds=0, timeout_rate=1.0, timeout_seconds=0).generate("Q", CONTEXT)
+
+
+@pytest.mark.asyncio
+async def test_generate_rate_limited():
+    """Test that calls beyond the tokens-per-minute budget are rejected"""
+    llm = MockLLM(latency_seconds=0, tokens_per_minute=2500)
+    await llm.generate("Q", CONTEXT)
+    await llm.generate("Q", CONTEXT)
+    with pytest.raises(MockLLMRateLimited):
+        await llm.generate("Q", CONTEXT)
+
+
+@pytest.mark.asyncio
+async def test_generate_answer_retries_rate_limited(monkeypatch):
+    """Test that the worker backs off and retries until the token budget refills"""
+    monkeypatch.setattr(settings, "llm_rate_limit_retries", 5)
+    monkeypatch.setattr(settings, "llm_retry_backoff_seconds", 1)
+    llm_failures.clear()
+    # Two 600-token calls against 1000 tokens per simulated minute: the second
+    # call has to wait about 12 simulated seconds for the bucket to refill
+    llm = MockLLM(latency_seconds=0, tokens_per_minute=1000, time_scale=0.01)
+    context = " ".join(["word"] * 599)
+    
+    await generate_answer("Q", context, llm)
+    answer = await generate_answer("Q", context, llm)
+    
+    assert answer.startswith("This is a generated answer")
+    assert llm_failures["rate_limited"] > 0
+
+
+@pytest.mark.asyncio
+async def test_generate_answer_gives_up(monkeypatch):
+    """Test that retries are bounded and other failures are not retried"""
+    monkeypatch.setattr(settings, "llm_rate_limit_retries", 2)
+    monkeypatch.setattr(settings, "llm_retry_backoff_seconds", 0)
+    llm_failures.clear()
+    
+    with pytest.raises(MockLLMRateLimited):
+        await generate_answer("Q", CONTEXT, MockLLM(latency_seconds=0, tokens_per_minute=10))
+    assert llm_failures["rate_limited"] == 3
+    
+    with pytest.raises(MockLLMError):
+        await generate_answer("Q", CONTEXT, MockLLM(latency_seconds=0, error_rate=1.0))
+    assert llm_failures["error"] == 1
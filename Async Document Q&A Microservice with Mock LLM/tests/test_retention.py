@@ -0,0 +1,165 @@
+import asyncio
+import json
+import logging
+import pytest
+from datetime import datetime, timedelta, timezone
+from httpx import AsyncClient
+from sqlalchemy import select, text
+
+from app.main import app
+from app.database import get_session_factory, dispose_engine
+from app.config import settings
+from app.models import ArchivedQuestion, Document, Question
+from app.models.question import QuestionStatus
+from app.services.export_service import ExportService
+from app.services.retention_service import RetentionService, run_archival_job
+
+NOW = datetime.now(timezone.utc)
+
+
+@pytest.fixture
+async def questions(database):
+    """Three old answered, one old pending and one recent answered question"""
+    async with get_session_factory()() as db:
+        document = Document(title="Retention", content="Retention document")
+        db.add(document)
+        await db.flush()
+        
+        old = [
+            Question(
+                document_id=document.id,
+                question=f"Old {i}",
+                answer=f"Answer {i}",
+                status=QuestionStatus.ANSWERED,
+                created_at=NOW - timedelta(days=40, minutes=i),
+                updated_at=NOW - timedelta(days=40),
+            )
+            for i in range(3)
+        ]
+        pending = Question(
+            document_id=document.id,
+            question="Old pending",
+            status=QuestionStatus.PENDING,
+            created_at=NOW - timedelta(days=40),
+        )
+        recent = Question(
+            document_id=document.id,
+            question="Recent",
+            answer="Recent answer",
+            status=QuestionStatus.ANSWERED,
+            created_at=NOW - timedelta(days=1),
+            updated_at=NOW - timedelta(days=1),
+        )
+        db.add_all([*old, pending, recent])
+        await db.commit()
+        ids = {"old": [q.id for q in old], "pending": pending.id, "recent": recent.id}
+    
+    yield ids
+    await dispose_engine()
+
+
+@pytest.mark.asyncio
+async def test_archive_expired_moves_old_answered_questions_in_batches(questions):
+    """Test that only old answered questions move, in bounded batches"""
+    async with get_session_factory()() as db:
+        service = RetentionService(db)
+        assert await service.archive_batch(NOW - timedelta(days=30), batch_size=2) == 2
+        assert await service.archive_expired(retention_days=30, batch_size=2, pause_seconds=0) == 1
+        
+        remaining = (await db.execute(select(Question.id).order_by(Question.id))).scalars().all()
+        archived = (await db.execute(select(ArchivedQuestion).order_by(ArchivedQuestion.id))).scalars().all()
+    
+    assert remaining == sorted([questions["pending"], questions["recent"]])
+    assert [a.id for a in archived] == sorted(questions["old"])
+    assert {a.answer for a in archived} == {"Answer 0", "Answer 1", "Answer 2"}
+    assert all(a.answered_at is not None for a in archived)
+
+
+@pytest.mark.asyncio
+async def test_archived_question_is_no_longer_served(questions):
+    """Test that archived questions are removed from the live table and the response cache"""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        # Cache the answered question before it is archived
+        response = await client.get(f"/questions/{questions['old'][0]}")
+        assert response.status_code == 200
+        
+        async with get_session_factory()() as db:
+            await RetentionService(db).archive_expired(retention_days=30, pause_seconds=0)
+        
+        response = await client.get(f"/questions/{questions['old'][0]}")
+        assert response.status_code == 404
+        response = await client.get(f"/questions/{questions['recent']}")
+        assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_exports_include_archived_questions(questions):
+    """Test that exports and latency statistics still cover archived answers"""
+    async with get_session_factory()() as db:
+        await RetentionService(db).archive_expired(retention_days=30, pause_seconds=0)
+    
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/exports/answers")
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(row["question_id"] for row in rows) == sorted([*questions["old"], questions["recent"]])
+        
+        response = await client.get("/exports/latency")
+        assert response.status_code == 200
+        assert response.json()[0]["answered"] == 4
+        
+        # Incremental exports filter archived rows by answer time too
+        response = await client.get("/exports/answers", params={"since": (NOW - timedelta(days=41)).isoformat()})
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["question_id"] for row in rows] == [*questions["old"], questions["recent"]]
+        
+        response = await client.get("/exports/answers", params={"since": (NOW - timedelta(days=2)).isoformat()})
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["question_id"] for row in rows] == [questions["recent"]]
+        
+        response = await client.get("/exports/latency", params={"since": (NOW - timedelta(days=2)).isoformat()})
+        assert response.json()[0]["answered"] == 1
+
+
+@pytest.mark.asyncio
+async def test_incremental_export_seeks_both_tables(questions, database):
+    """Test that a watermark export reads both tables in index order without sorting"""
+    if not database.startswith("sqlite"):
+        pytest.skip("checks SQLite's EXPLAIN QUERY PLAN output")
+    
+    async with get_session_factory()() as db:
+        for document_id in (None, 1):
+            query = ExportService(db).answers_query(document_id=document_id, since=NOW - timedelta(days=1))
+            compiled = query.compile(db.get_bind(), compile_kwargs={"literal_binds": True})
+            result = await db.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+            plan = "\n".join(row[-1] for row in result)
+            
+            assert "SEARCH questions USING INDEX ix_questions_status_updated_at" in plan
+            assert "SEARCH questions_archive USING INDEX ix_questions_archive_" in plan
+            assert "SCAN" not in plan
+            assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.asyncio
+async def test_archival_job_logs_failures(monkeypatch, caplog):
+    """Test that a failing archival run is logged and retried later"""
+    async def fail(self):
+        raise RuntimeError("database is locked")
+    
+    monkeypatch.setattr(RetentionService, "archive_expired", fail)
+    monkeypatch.setattr(settings, "database_url", "sqlite+aiosqlite://")
+    monkeypatch.setattr(settings, "archive_interval_seconds", 3600)
+    # Migrations run by other tests configure logging with fileConfig, which
+    # disables loggers that already exist
+    monkeypatch.setattr(logging.getLogger("app.services.retention_service"), "disabled", False)
+    
+    with caplog.at_level(logging.ERROR, logger="app.services.retention_service"):
+        task = asyncio.create_task(run_archival_job())
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    await dispose_engine()
+    
+    assert "Archiving expired questions failed" in caplog.text
+    assert "database is locked" in caplog.text
@@ -0,0 +1,36 @@
+from datetime import datetime, timezone
+from app.api.responses import ModelResponse
+from app.models import Document, Question
+from app.models.question import QuestionStatus
+from app.schemas import DocumentResponse, QuestionResponse
+
+
+def test_from_record_matches_validated_document():
+    """Test that the unvalidated path renders the same JSON as model_validate"""
+    document = Document(
+        id=1,
+        title="Title",
+        content="Content",
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        updated_at=None,
+    )
+
+    rendered = ModelResponse(DocumentResponse.from_record(document)).body
+    assert rendered == DocumentResponse.model_validate(document).model_dump_json().encode()
+
+
+def test_from_record_matches_validated_question():
+    """Test that enum and optional fields render the same as model_validate"""
+    question = Question(
+        id=2,
+        document_id=1,
+        question="Why?",
+        answer="Because.",
+        status=QuestionStatus.ANSWERED,
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        updated_at=datetime(2024, 1, 1, 0, 0, 5, tzinfo=timezone.utc),
+    )
+
+    rendered = ModelResponse(QuestionResponse.from_record(question)).body
+    assert rendered == QuestionResponse.model_validate(question).model_dump_json().encode()
+    assert b'"status":"answered"' in rendered
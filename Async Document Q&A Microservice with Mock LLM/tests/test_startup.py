@@ -0,0 +1,19 @@
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_import_does_not_create_engine_or_load_server():
+    """Test that importing the app defers engine, driver and server imports"""
+    code = (
+        "import sys\n"
+        "import app.main\n"
+        "import app.database as database\n"
+        "assert database._engine is None\n"
+        "assert 'asyncpg' not in sys.modules\n"
+        "assert 'sqlalchemy.ext.asyncio' not in sys.modules\n"
+        "assert 'uvicorn' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, check=True)